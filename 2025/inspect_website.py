@@ -3,33 +3,83 @@ Website Structure Inspector
 Downloads and analyzes the Supreme Court website structure
 """
 
+import os
+import sys
 import requests
 import ssl
-from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 import time
 import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Shared HTTP session for the static pass. ACCEPT_ENCODING advertises
+# gzip/deflate plus br and zstd when brotli / zstandard are installed,
+# so urllib3 only asks for encodings it can decode.
+SESSION = requests.Session()
+SESSION.verify = False
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING
+})
+
+# Collect select/input properties in one WebDriver round-trip per element
+SELECT_INFO_JS = (
+    "const s = arguments[0];"
+    "return {id: s.id, name: s.name, count: s.options.length,"
+    " opts: Array.from(s.options).slice(0, 5).map(o => [o.textContent.trim(), o.value])};"
+)
+INPUT_INFO_JS = (
+    "const i = arguments[0];"
+    "return {id: i.id, name: i.name, type: i.type, value: i.value};"
+)
+
+# Set by analyze_form_elements when the server-rendered HTML already exposes
+# the populated search dropdowns, so the Selenium passes add nothing
+_STATIC_SUFFICIENT = False
+
+def create_driver(headless=True):
+    """Create a Chrome driver with the fast inspection profile"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--ignore-ssl-errors')
+    options.add_argument('--ignore-certificate-errors')
+    options.add_argument('--allow-running-insecure-content')
+    
+    # Strip subsystems that are unused during inspection
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-logging')
+    options.add_argument('--log-level=3')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-features=Translate,AutofillServerCommunication')
+    
+    # Send chromedriver logs nowhere
+    service = Service(log_output=os.devnull)
+    
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(60)
+    return driver
+
 def download_website_structure():
     """Download website HTML using requests"""
     print("🌐 Downloading website structure...")
     
     try:
-        # Configure requests to handle SSL issues
-        session = requests.Session()
-        session.verify = False
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
         url = "https://scp.gov.pk/OnlineCaseInformation.aspx"
-        response = session.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, timeout=30)
         
         if response.status_code == 200:
             with open("website_structure.html", "w", encoding="utf-8") as f:
@@ -46,50 +96,84 @@ def download_website_structure():
 
 def analyze_form_elements():
     """Analyze form elements in the downloaded HTML"""
+    global _STATIC_SUFFICIENT
     print("\n📋 Analyzing form elements...")
     
     try:
-        with open("website_structure.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find all form elements
-        forms = soup.find_all('form')
-        print(f"   Found {len(forms)} forms")
-        
-        # Find all select dropdowns
-        selects = soup.find_all('select')
-        print(f"   Found {len(selects)} select elements:")
-        for select in selects:
-            select_id = select.get('id', 'No ID')
-            select_name = select.get('name', 'No Name')
-            options = select.find_all('option')
-            print(f"     - ID: {select_id}, Name: {select_name}, Options: {len(options)}")
+        form_count = 0
+        select_info = []
+        input_info = []
+        button_info = []
+        
+        # Stream the file and only materialize the tags we report on
+        with open("website_structure.html", "rb") as f:
+            context = etree.iterparse(f, events=('end',), tag=('form', 'select', 'input', 'button'), html=True)
+            for event, elem in context:
+                if elem.tag == 'form':
+                    form_count += 1
+                elif elem.tag == 'select':
+                    options = list(elem.iter('option'))
+                    select_info.append((
+                        elem.get('id', 'No ID'),
+                        elem.get('name', 'No Name'),
+                        len(options),
+                        [(''.join(o.itertext()).strip(), o.get('value', '')) for o in options[:5]]
+                    ))
+                elif elem.tag == 'input':
+                    input_info.append((
+                        elem.get('id', 'No ID'),
+                        elem.get('name', 'No Name'),
+                        elem.get('type', 'No Type'),
+                        elem.get('value', 'No Value')
+                    ))
+                else:
+                    button_info.append((
+                        elem.get('id', 'No ID'),
+                        ''.join(elem.itertext()).strip() or elem.get('value', 'No Text')
+                    ))
+                
+                # Release the element (and anything it holds) as soon as it is read
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    parent.remove(elem)
             
-            # Show first few options
-            for i, option in enumerate(options[:5]):
-                option_text = option.get_text(strip=True)
-                option_value = option.get('value', '')
-                print(f"       Option {i+1}: '{option_text}' (value: '{option_value}')")
+            # Drop what is left of the parse tree before the print loops;
+            # everything reported below lives in the plain tuples above
+            if context.root is not None:
+                context.root.clear()
+            del context
         
-        # Find all input elements
-        inputs = soup.find_all('input')
-        print(f"\n   Found {len(inputs)} input elements:")
-        for input_elem in inputs:
-            input_id = input_elem.get('id', 'No ID')
-            input_name = input_elem.get('name', 'No Name')
-            input_type = input_elem.get('type', 'No Type')
-            input_value = input_elem.get('value', 'No Value')
-            print(f"     - ID: {input_id}, Name: {input_name}, Type: {input_type}, Value: {input_value}")
-        
-        # Find all buttons
-        buttons = soup.find_all(['button', 'input[type="submit"]'])
-        print(f"\n   Found {len(buttons)} buttons:")
-        for button in buttons:
-            button_id = button.get('id', 'No ID')
-            button_text = button.get_text(strip=True) or button.get('value', 'No Text')
-            print(f"     - ID: {button_id}, Text: '{button_text}'")
+        print(f"   Found {form_count} forms")
+        
+        _STATIC_SUFFICIENT = bool(select_info) and all(info[2] > 0 for info in select_info)
+        
+        # Buffer report lines and emit each section with a single write
+        lines = []
+        
+        # Select dropdowns
+        lines.append(f"   Found {len(select_info)} select elements:")
+        for select_id, select_name, option_count, options in select_info:
+            lines.append(f"     - ID: {select_id}, Name: {select_name}, Options: {option_count}")
+            
+            # Show first few options
+            for i, (option_text, option_value) in enumerate(options):
+                lines.append(f"       Option {i+1}: '{option_text}' (value: '{option_value}')")
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+        
+        # Input elements
+        lines.append(f"\n   Found {len(input_info)} input elements:")
+        for input_id, input_name, input_type, input_value in input_info:
+            lines.append(f"     - ID: {input_id}, Name: {input_name}, Type: {input_type}, Value: {input_value}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+        
+        # Buttons
+        lines.append(f"\n   Found {len(button_info)} buttons:")
+        for button_id, button_text in button_info:
+            lines.append(f"     - ID: {button_id}, Text: '{button_text}'")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return True
         
@@ -102,17 +186,7 @@ def inspect_with_selenium():
     print("\n🔍 Inspecting website with Selenium...")
     
     try:
-        # Setup Chrome options
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--ignore-ssl-errors')
-        options.add_argument('--ignore-certificate-errors')
-        options.add_argument('--allow-running-insecure-content')
-        
-        driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(60)
+        driver = create_driver()
         
         print("   Navigating to website...")
         driver.get("https://scp.gov.pk/OnlineCaseInformation.aspx")
@@ -124,40 +198,39 @@ def inspect_with_selenium():
         page_source = driver.page_source
         with open("selenium_source.html", "w", encoding="utf-8") as f:
             f.write(page_source)
+        del page_source
+        
+        lines = []
         
         # Find all select elements
         selects = driver.find_elements(By.TAG_NAME, "select")
-        print(f"   Found {len(selects)} select elements:")
+        lines.append(f"   Found {len(selects)} select elements:")
         
         for i, select in enumerate(selects):
             try:
-                select_id = select.get_attribute("id")
-                select_name = select.get_attribute("name")
-                options = select.find_elements(By.TAG_NAME, "option")
-                print(f"     Select {i+1}: ID='{select_id}', Name='{select_name}', Options={len(options)}")
+                info = driver.execute_script(SELECT_INFO_JS, select)
+                lines.append(f"     Select {i+1}: ID='{info['id']}', Name='{info['name']}', Options={info['count']}")
                 
                 # Show options
-                for j, option in enumerate(options[:5]):
-                    option_text = option.text
-                    option_value = option.get_attribute("value")
-                    print(f"       Option {j+1}: '{option_text}' (value: '{option_value}')")
+                for j, (option_text, option_value) in enumerate(info['opts']):
+                    lines.append(f"       Option {j+1}: '{option_text}' (value: '{option_value}')")
                     
             except Exception as e:
-                print(f"       Error reading select {i+1}: {e}")
+                lines.append(f"       Error reading select {i+1}: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
         
         # Find all input elements
         inputs = driver.find_elements(By.TAG_NAME, "input")
-        print(f"\n   Found {len(inputs)} input elements:")
+        lines.append(f"\n   Found {len(inputs)} input elements:")
         
         for i, input_elem in enumerate(inputs):
             try:
-                input_id = input_elem.get_attribute("id")
-                input_name = input_elem.get_attribute("name")
-                input_type = input_elem.get_attribute("type")
-                input_value = input_elem.get_attribute("value")
-                print(f"     Input {i+1}: ID='{input_id}', Name='{input_name}', Type='{input_type}', Value='{input_value}'")
+                info = driver.execute_script(INPUT_INFO_JS, input_elem)
+                lines.append(f"     Input {i+1}: ID='{info['id']}', Name='{info['name']}', Type='{info['type']}', Value='{info['value']}'")
             except Exception as e:
-                print(f"       Error reading input {i+1}: {e}")
+                lines.append(f"       Error reading input {i+1}: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         driver.quit()
         print("✅ Selenium inspection completed")
@@ -174,14 +247,7 @@ def extract_sample_data():
     print("\n🧪 Testing sample data extraction...")
     
     try:
-        options = Options()
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--ignore-ssl-errors')
-        options.add_argument('--ignore-certificate-errors')
-        
-        driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(60)
+        driver = create_driver(headless=False)
         
         print("   Navigating to website...")
         driver.get("https://scp.gov.pk/OnlineCaseInformation.aspx")
@@ -216,6 +282,7 @@ def extract_sample_data():
                 pass
         
         print(f"   Found {len(elements_with_2025)} elements containing '2025'")
+        del all_elements, elements_with_2025
         
         # Try to find the results table
         tables = driver.find_elements(By.TAG_NAME, "table")
@@ -229,11 +296,14 @@ def extract_sample_data():
             
             if len(rows) > 1:
                 # Check first few rows
+                lines = []
                 for i, row in enumerate(rows[:3]):
                     cells = row.find_elements(By.TAG_NAME, "td")
                     if cells:
                         row_text = " | ".join([cell.text[:50] for cell in cells])
-                        print(f"     Row {i+1}: {row_text}")
+                        lines.append(f"     Row {i+1}: {row_text}")
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
         
         # Save page source for manual inspection
         page_source = driver.page_source
@@ -255,15 +325,21 @@ def main():
     print("🔍 Supreme Court Website Structure Inspector")
     print("=" * 50)
     
+    force_selenium = '--force-selenium' in sys.argv[1:]
+    
     # Step 1: Download static HTML
     if download_website_structure():
         analyze_form_elements()
     
-    # Step 2: Inspect with Selenium
-    inspect_with_selenium()
-    
-    # Step 3: Test sample extraction
-    extract_sample_data()
+    if _STATIC_SUFFICIENT and not force_selenium:
+        print("\n⏭️ Static HTML already exposes the search form, skipping Selenium passes")
+        print("   (run with --force-selenium to inspect the live page anyway)")
+    else:
+        # Step 2: Inspect with Selenium
+        inspect_with_selenium()
+        
+        # Step 3: Test sample extraction
+        extract_sample_data()
     
     print("\n" + "=" * 50)
     print("🎯 Inspection completed!")
@@ -7,8 +7,11 @@ import time
 import re
 import json
 import os
+import shutil
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -17,27 +20,106 @@ from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
 import threading
 from queue import Queue
 
+# orjson is much faster for the final dump; fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Locator for the per-case links on the search results page
+VIEW_DETAILS_XPATH = "//a[contains(text(), 'View Details')]"
+
+# Extracts (event target, event argument) from a javascript:__doPostBack(...) href
+POSTBACK_RE = re.compile(r"__doPostBack\('([^']*)','([^']*)'\)")
+
+# Precompiled patterns and keyword tuples for the per-case parse loop
+_UNSAFE_RE = re.compile(r'[<>:"/\\|?*]')
+_JUDG_KW = ('judgment', 'order')
+
+# Stands in for spAOR's <br> tags while its text is read (a private-use
+# character, so it cannot clash with page text)
+_BR_MARK = '\ue000'
+
+# Search page and the dropdown values for C.A. / Lahore / 2025
+SEARCH_URL = "https://scp.gov.pk/OnlineCaseInformation.aspx"
+SEARCH_FORM = {
+    'ddlCaseType': '1',   # C.A.
+    'ddlRegistry': 'L',   # Lahore
+    'ddlYear': '2025',
+}
+
+# Static resources the extractor never looks at; blocked in the browser's
+# network stack so they are not fetched on any navigation
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+    "*.woff*", "*.ttf", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*gtag*",
+]
+
+
+def _clean_text(el):
+    """Text of an element with whitespace runs (source newlines, indentation)
+    collapsed to single spaces"""
+    return ' '.join(el.text_content().split())
+
 
 class MultiBrowserCALahore2025Extractor:
     """High-speed extractor using multiple browser instances for parallel processing"""
     
-    def __init__(self, max_workers=4):
+    def __init__(self, max_workers=4, download_pdfs=False):
         self.max_workers = max_workers
+        self.download_pdfs = download_pdfs
         self.extracted_cases = []
         self.base_url = "https://scp.gov.pk"
         self.case_queue = Queue()
-        self.results_lock = threading.Lock()
         
-        # Create links directory info (no actual downloads)
-        self.downloads_dir = "ca_lahore_2025_pdf_links"
-        print(f"📋 PDF links will be captured (no downloads) in: {self.downloads_dir}")
+        # Postback targets of the result list, parsed once by the scout
+        self.case_targets = []
+        
+        # Hidden ASP.NET fields of this worker's results page, used to replay
+        # View Details postbacks over HTTP
+        self.form_state = None
+        
+        # Case numbers already captured by any worker. run_parallel_extraction
+        # swaps these for Manager proxies so all worker processes share them
+        self._seen_cases = {}
+        self._seen_lock = threading.Lock()
+        
+        # Inner pool for PDF downloads so browser workers never block on them
+        self.download_pool = ThreadPoolExecutor(max_workers=max_workers * 4)
+        
+        # Pooled HTTP session shared by all workers - every PDF lives on the
+        # same host, so keep-alive reuses the TLS connection across files
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.verify = False
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive'
+        })
+        
+        if download_pdfs:
+            self.downloads_dir = "ca_lahore_2025_pdfs"
+            print(f"📥 PDF files will be downloaded to: {self.downloads_dir}")
+        else:
+            # Create links directory info (no actual downloads)
+            self.downloads_dir = "ca_lahore_2025_pdf_links"
+            print(f"📋 PDF links will be captured (no downloads) in: {self.downloads_dir}")
         
         print(f"✅ Multi-Browser C.A. Lahore 2025 Extractor initialized with {max_workers} workers")
     
@@ -74,6 +156,10 @@ class MultiBrowserCALahore2025Extractor:
             # Memory optimizations
             options.add_argument('--memory-pressure-off')
             options.add_argument('--max_old_space_size=4096')
+            options.add_argument('--renderer-process-limit=1')
+            options.add_argument('--disk-cache-size=33554432')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--disable-software-rasterizer')
             
             # Network optimizations
             options.add_argument('--aggressive-cache-discard')
@@ -92,6 +178,15 @@ class MultiBrowserCALahore2025Extractor:
             driver.set_page_load_timeout(30)
             driver.implicitly_wait(5)
             
+            # Block images/fonts/css/analytics at the network level and never
+            # let the browser save PDFs itself (they are fetched over HTTP)
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+                driver.execute_cdp_cmd("Page.setDownloadBehavior", {"behavior": "deny"})
+            except Exception as e:
+                print(f"⚠️ Could not apply network blocking: {e}")
+            
             return driver
         except Exception as e:
             print(f"❌ Failed to create driver: {e}")
@@ -100,10 +195,8 @@ class MultiBrowserCALahore2025Extractor:
     def navigate_and_search(self, driver, worker_id):
         """Navigate to website and perform search for a worker"""
         try:
-            url = "https://scp.gov.pk/OnlineCaseInformation.aspx"
             print(f"🌐 Worker {worker_id}: Navigating to website")
-            driver.get(url)
-            time.sleep(3)
+            driver.get(SEARCH_URL)
             
             # Wait for page to load completely
             WebDriverWait(driver, 10).until(
@@ -116,7 +209,6 @@ class MultiBrowserCALahore2025Extractor:
             )
             select = Select(case_type_select)
             select.select_by_value('1')  # C.A.
-            time.sleep(1)
             
             # Select registry: Lahore
             registry_select = WebDriverWait(driver, 10).until(
@@ -124,7 +216,6 @@ class MultiBrowserCALahore2025Extractor:
             )
             select = Select(registry_select)
             select.select_by_value('L')  # Lahore
-            time.sleep(1)
             
             # Select year: 2025
             year_select = WebDriverWait(driver, 10).until(
@@ -132,17 +223,31 @@ class MultiBrowserCALahore2025Extractor:
             )
             select = Select(year_select)
             select.select_by_value('2025')
-            time.sleep(1)
             
-            # Click search button with better handling
+            # Click search button via JS - a JS click needs no scrolling into view,
+            # so this is a single round-trip
             search_button = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.ID, 'btnSearch'))
             )
-            driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-            time.sleep(1)
             driver.execute_script("arguments[0].click();", search_button)
             print(f"🔍 Worker {worker_id}: Search button clicked")
-            time.sleep(5)
+            
+            # Proceed as soon as the results list is rendered
+            if not self.wait_for_results(driver):
+                print(f"❌ Worker {worker_id}: No results appeared after search")
+                return False
+            
+            # Capture the post-search form state and session cookies so detail
+            # pages can be fetched over HTTP without rendering them in Chrome
+            try:
+                self.form_state = self.extract_form_state(driver.page_source)
+                self.form_state.update(SEARCH_FORM)
+                for cookie in driver.get_cookies():
+                    self.session.cookies.set(cookie['name'], cookie['value'],
+                                             domain=cookie.get('domain'), path=cookie.get('path', '/'))
+            except Exception as e:
+                self.form_state = None
+                print(f"⚠️ Worker {worker_id}: Could not capture form state - {e}")
             
             print(f"✅ Worker {worker_id}: Search completed")
             return True
@@ -151,25 +256,36 @@ class MultiBrowserCALahore2025Extractor:
             print(f"❌ Worker {worker_id}: Search failed - {e}")
             return False
     
-    def handle_form_resubmission(self, driver):
-        """Handle form resubmission error"""
+    def handle_form_resubmission(self, driver, page_source=None):
+        """Handle form resubmission error (reuses page_source when the caller already has it)"""
         try:
-            page_source = driver.page_source.lower()
+            if page_source is None:
+                page_source = driver.page_source
+            page_source = page_source.lower()
             
             if ("confirm form resubmission" in page_source or 
                 "err_cache_miss" in page_source or
                 "resubmit" in page_source):
                 
                 driver.refresh()
-                time.sleep(2)
                 return True
             
             return False
         except Exception as e:
             return False
     
+    def wait_for_results(self, driver, timeout=15):
+        """Wait until the View Details links of the results list are present"""
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, VIEW_DETAILS_XPATH))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def download_pdf(self, pdf_url, case_no, pdf_type, worker_id):
-        """Store PDF link information without downloading"""
+        """Store PDF link information, or download it when download_pdfs is enabled"""
         try:
             if not pdf_url or pdf_url == "N/A" or "not available" in pdf_url.lower():
                 return "No PDF Available"
@@ -178,34 +294,155 @@ class MultiBrowserCALahore2025Extractor:
             if pdf_url.startswith('/'):
                 pdf_url = urljoin(self.base_url, pdf_url)
             
-            # Return the link without downloading
-            print(f"📄 Worker {worker_id}: PDF link captured for {case_no} ({pdf_type})")
-            return f"PDF Link Available: {pdf_url}"
+            if not self.download_pdfs:
+                # Return the link without downloading
+                print(f"📄 Worker {worker_id}: PDF link captured for {case_no} ({pdf_type})")
+                return f"PDF Link Available: {pdf_url}"
+            
+            os.makedirs(self.downloads_dir, exist_ok=True)
+            
+            safe_case_no = _UNSAFE_RE.sub('_', case_no)
+            filename = f"{safe_case_no}_{pdf_type}.pdf"
+            local_path = os.path.join(self.downloads_dir, filename)
+            
+            # Already fetched by an earlier run - nothing to do
+            if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                print(f"⏭️ Worker {worker_id}: {filename} already downloaded")
+                return local_path
             
+            print(f"⬇️ Worker {worker_id}: Downloading {filename}")
+            part_path = local_path + '.part'
+            with self.session.get(pdf_url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                
+                # Stream straight from the socket to disk in 64KB blocks
+                response.raw.decode_content = True
+                with open(part_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+            
+            # Only a complete download gets the final name, so an interrupted
+            # run never leaves a truncated PDF that the check above would skip
+            os.replace(part_path, local_path)
+            
+            print(f"✅ Worker {worker_id}: Downloaded {filename}")
+            return local_path
+            
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Worker {worker_id}: Download failed for {case_no} - {e}")
+            return f"Download Failed: {str(e)}"
         except Exception as e:
             return f"Link Processing Failed: {str(e)}"
     
-    def extract_detailed_case_info(self, driver, case_index, worker_id):
+    def has_pdf(self, path):
+        """Check whether a Downloaded_Path value points at a captured link or downloaded file"""
+        if not path:
+            return False
+        if self.download_pdfs:
+            return os.path.exists(path)
+        return 'PDF Link Available' in path
+    
+    def get_case_targets(self, driver):
+        """Read the __doPostBack target of every View Details link on the results page"""
+        return self.parse_case_targets(driver.page_source)
+    
+    def parse_case_targets(self, html):
+        """Parse (event target, event argument) pairs of the View Details links from HTML"""
+        soup = BeautifulSoup(html, 'lxml')
+        case_targets = []
+        for link in soup.find_all('a', href=True):
+            if link.get_text(strip=True) != 'View Details':
+                continue
+            match = POSTBACK_RE.search(link['href'])
+            if match:
+                case_targets.append(match.groups())
+        return case_targets
+    
+    def extract_form_state(self, html):
+        """Collect the ASP.NET hidden fields (__VIEWSTATE, __EVENTVALIDATION, ...) from a page"""
+        root = lxml.html.fromstring(html)
+        return {
+            field.get('name'): field.get('value', '')
+            for field in root.xpath("//input[@type='hidden'][@name]")
+        }
+    
+    def scout_with_requests(self):
+        """Run the search as a plain form POST and return (total_cases, case_targets)"""
+        try:
+            print("🌐 Scout: Fetching search form over HTTP")
+            response = self.session.get(SEARCH_URL, timeout=30)
+            response.raise_for_status()
+            
+            form_data = self.extract_form_state(response.text)
+            form_data.update(SEARCH_FORM)
+            form_data.update({
+                '__EVENTTARGET': '',
+                '__EVENTARGUMENT': '',
+                'btnSearch': 'Search'
+            })
+            
+            response = self.session.post(SEARCH_URL, data=form_data, timeout=30)
+            response.raise_for_status()
+            
+            case_targets = self.parse_case_targets(response.text)
+            print(f"📋 Scout: {len(case_targets)} cases found over HTTP")
+            return len(case_targets), case_targets
+            
+        except Exception as e:
+            print(f"⚠️ Scout: HTTP search failed - {e}")
+            return 0, []
+    
+    
+    def fetch_detail_html(self, event_target, event_argument):
+        """Replay a View Details postback over HTTP; returns the detail HTML or None"""
+        if not self.form_state:
+            return None
+        try:
+            form_data = dict(self.form_state)
+            form_data['__EVENTTARGET'] = event_target
+            form_data['__EVENTARGUMENT'] = event_argument
+            
+            response = self.session.post(SEARCH_URL, data=form_data, timeout=30)
+            if response.status_code == 200 and 'id="spCaseNo"' in response.text:
+                return response.text
+        except requests.exceptions.RequestException:
+            pass
+        
+        # Viewstate rotated or the request failed - let the caller use the browser
+        return None
+    
+    def extract_detailed_case_info(self, driver, case_index, worker_id, case_targets):
         """Extract detailed case information for a specific case"""
+        browser_source = None
+        claimed_case_no = None
         try:
             print(f"🔍 Worker {worker_id}: Processing case {case_index + 1}")
             
-            # Get View Details links
-            view_details_links = driver.find_elements(By.XPATH, "//a[contains(text(), 'View Details')]")
-            
-            if case_index >= len(view_details_links):
+            if case_index >= len(case_targets):
                 print(f"⚠️ Worker {worker_id}: Case index {case_index} out of range")
                 return None
             
-            # Click View Details
-            link = view_details_links[case_index]
-            driver.execute_script("arguments[0].scrollIntoView(true);", link)
-            time.sleep(0.5)
-            driver.execute_script("arguments[0].click();", link)
-            time.sleep(2)
+            event_target, event_argument = case_targets[case_index]
             
-            # Extract information using BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            # Try the postback over plain HTTP first. page_source is read once
+            # and reused by the parse below and by the error recovery
+            page_source = self.fetch_detail_html(event_target, event_argument)
+            
+            if page_source is None:
+                # Fire the View Details postback in the browser. The detail page
+                # still carries the results grid, so no driver.back() is needed
+                old_root = driver.find_element(By.TAG_NAME, "html")
+                driver.execute_script("__doPostBack(arguments[0], arguments[1]);", event_target, event_argument)
+                
+                # The postback replaces the page: wait for the old document to go
+                # stale, then for the case details to be rendered
+                WebDriverWait(driver, 15).until(EC.staleness_of(old_root))
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.ID, "spCaseNo"))
+                )
+                page_source = browser_source = driver.page_source
+            
+            # Parse once with lxml; every lookup below runs on this one tree
+            tree = lxml.html.fromstring(page_source)
             
             # Initialize case structure
             case_data = {
@@ -217,7 +454,8 @@ class MultiBrowserCALahore2025Extractor:
                 "Advocates": {
                     "ASC": "N/A",
                     "AOR": "N/A",
-                    "Prosecutor": "N/A"
+                    "Prosecutor": "N/A",
+                    "Other": "N/A"
                 },
                 "Petition_Appeal_Memo": {
                     "File": "N/A",
@@ -236,59 +474,70 @@ class MultiBrowserCALahore2025Extractor:
             }
             
             # Extract Case No from spCaseNo
-            case_no_span = soup.find('span', {'id': 'spCaseNo'})
-            if case_no_span:
-                case_data["Case_No"] = case_no_span.get_text(strip=True)
+            case_no_span = tree.get_element_by_id('spCaseNo', None)
+            if case_no_span is not None:
+                case_data["Case_No"] = _clean_text(case_no_span)
+            
+            # Skip cases another worker already captured (e.g. when the site
+            # reorders results mid-run) before doing any PDF work for them
+            case_no = case_data["Case_No"]
+            if case_no and case_no != "N/A":
+                with self._seen_lock:
+                    is_new = case_no not in self._seen_cases
+                    self._seen_cases[case_no] = True
+                if not is_new:
+                    print(f"⏭️ Worker {worker_id}: {case_no} already captured, skipping")
+                    return None
+                claimed_case_no = case_no
             
             # Extract Case Title from spCaseTitle  
-            case_title_span = soup.find('span', {'id': 'spCaseTitle'})
-            if case_title_span:
-                case_data["Case_Title"] = case_title_span.get_text(strip=True)
+            case_title_span = tree.get_element_by_id('spCaseTitle', None)
+            if case_title_span is not None:
+                case_data["Case_Title"] = _clean_text(case_title_span)
             
             # Extract Status from spStatus
-            status_span = soup.find('span', {'id': 'spStatus'})
-            if status_span:
-                case_data["Status"] = status_span.get_text(strip=True)
+            status_span = tree.get_element_by_id('spStatus', None)
+            if status_span is not None:
+                case_data["Status"] = _clean_text(status_span)
             
             # Extract Institution Date from spInstDate
-            inst_date_span = soup.find('span', {'id': 'spInstDate'})
-            if inst_date_span:
-                case_data["Institution_Date"] = inst_date_span.get_text(strip=True)
+            inst_date_span = tree.get_element_by_id('spInstDate', None)
+            if inst_date_span is not None:
+                case_data["Institution_Date"] = _clean_text(inst_date_span)
             
             # Extract Disposal Date from spDispDate
-            disp_date_span = soup.find('span', {'id': 'spDispDate'})
-            if disp_date_span:
-                case_data["Disposal_Date"] = disp_date_span.get_text(strip=True)
+            disp_date_span = tree.get_element_by_id('spDispDate', None)
+            if disp_date_span is not None:
+                case_data["Disposal_Date"] = _clean_text(disp_date_span)
             
             # Extract AOR/ASC from spAOR
-            aor_span = soup.find('span', {'id': 'spAOR'})
-            if aor_span:
-                aor_html = str(aor_span)
-                
-                if '<br>' in aor_html:
-                    parts = aor_html.split('<br>')
-                    for part in parts:
-                        clean_text = re.sub(r'<[^>]+>', '', part).strip()
-                        if '(AOR)' in clean_text:
-                            case_data["Advocates"]["AOR"] = clean_text
-                        elif '(ASC)' in clean_text:
-                            case_data["Advocates"]["ASC"] = clean_text
-                        elif 'prosecutor' in clean_text.lower():
-                            case_data["Advocates"]["Prosecutor"] = clean_text
-                else:
-                    aor_text = aor_span.get_text()
-                    lines = aor_text.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if '(AOR)' in line:
-                            case_data["Advocates"]["AOR"] = line
-                        elif '(ASC)' in line:
-                            case_data["Advocates"]["ASC"] = line
-                        elif 'prosecutor' in line.lower():
-                            case_data["Advocates"]["Prosecutor"] = line
+            aor_span = tree.get_element_by_id('spAOR', None)
+            if aor_span is not None:
+                # One advocate per <br>-separated line. A case can have several
+                # counsel of one role, so every line is kept and a role's names
+                # are joined with '; '. Lines of no known role (e.g. "Additional
+                # Advocate General Punjab (-)") go to Other
+                for br in aor_span.iter('br'):
+                    br.tail = _BR_MARK + (br.tail or '')
+                roles = {"AOR": [], "ASC": [], "Prosecutor": [], "Other": []}
+                for part in aor_span.text_content().split(_BR_MARK):
+                    line = ' '.join(part.split())
+                    if not line:
+                        continue
+                    if '(AOR)' in line:
+                        roles["AOR"].append(line)
+                    elif '(ASC)' in line:
+                        roles["ASC"].append(line)
+                    elif 'prosecutor' in line.lower():
+                        roles["Prosecutor"].append(line)
+                    else:
+                        roles["Other"].append(line)
+                for role, names in roles.items():
+                    if names:
+                        case_data["Advocates"][role] = "; ".join(names)
             
             # Enhanced PDF detection and download
-            pdf_links = soup.find_all('a', href=True)
+            pdf_links = tree.iter('a')
             
             # Collect all PDF files
             memo_files = []
@@ -296,37 +545,26 @@ class MultiBrowserCALahore2025Extractor:
             
             for link in pdf_links:
                 href = link.get('href', '')
-                link_text = link.get_text(strip=True)
+                if not href:
+                    continue
+                link_text = _clean_text(link)
+                lt = link_text.lower()
                 
                 # Enhanced detection for PDF links
-                if (href and 
-                    ('.pdf' in href.lower() or 
-                     'digital copy' in link_text.lower() or
-                     ('file' in link_text.lower() and '.pdf' in href.lower()))):
-                    
-                    print(f"🔍 Worker {worker_id}: Found potential PDF - '{link_text}' -> {href}")
-                    
-                    # Classify PDF type based on context and text
-                    if (any(keyword in link_text.lower() for keyword in ['digital copy', 'file', 'memo', 'petition', 'appeal']) and
-                        not any(keyword in link_text.lower() for keyword in ['judgment', 'order'])):
-                        memo_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
-                    elif any(keyword in link_text.lower() for keyword in ['judgment', 'order']):
-                        judgment_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
-                    else:
-                        # Default to memo if unclear
-                        memo_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
+                if '.pdf' not in href.lower() and 'digital copy' not in lt:
+                    continue
+                
+                print(f"🔍 Worker {worker_id}: Found potential PDF - '{link_text}' -> {href}")
+                
+                # Judgment/order links go to the judgment bucket, everything else
+                # (memo, petition, appeal, digital copy, unclear) to the memo bucket
+                is_judg = any(k in lt for k in _JUDG_KW)
+                bucket = judgment_files if is_judg else memo_files
+                bucket.append({'text': link_text, 'href': href, 'type': 'PDF'})
+            
+            # Dispatch every PDF of this case to the download pool so the
+            # transfers run concurrently with each other and the history parse
+            pending_downloads = {}
             
             # Handle memo files
             if memo_files:
@@ -341,19 +579,19 @@ class MultiBrowserCALahore2025Extractor:
                     
                     # Download each memo PDF
                     print(f"📄 Worker {worker_id}: Capturing PDF link {i+1}: {memo_file['text']}")
-                    link_info = self.download_pdf(
+                    future = self.download_pool.submit(
+                        self.download_pdf,
                         memo_file['href'], 
                         case_data["Case_No"], 
                         f"memo_{i+1}", 
                         worker_id
                     )
-                    file_info["Downloaded_Path"] = link_info
+                    pending_downloads[future] = file_info
                     case_data["Petition_Appeal_Memo"]["Files"].append(file_info)
                 
                 # Keep backward compatibility - use first file
                 case_data["Petition_Appeal_Memo"]["File"] = memo_files[0]['href']
                 case_data["Petition_Appeal_Memo"]["Type"] = "PDF"
-                case_data["Petition_Appeal_Memo"]["Downloaded_Path"] = case_data["Petition_Appeal_Memo"]["Files"][0]["Downloaded_Path"]
             
             # Handle judgment files
             if judgment_files:
@@ -368,53 +606,64 @@ class MultiBrowserCALahore2025Extractor:
                     
                     # Capture each judgment PDF link
                     print(f"📄 Worker {worker_id}: Capturing judgment link {i+1}: {judgment_file['text']}")
-                    link_info = self.download_pdf(
+                    future = self.download_pool.submit(
+                        self.download_pdf,
                         judgment_file['href'], 
                         case_data["Case_No"], 
                         f"judgment_{i+1}", 
                         worker_id
                     )
-                    file_info["Downloaded_Path"] = link_info
+                    pending_downloads[future] = file_info
                     case_data["Judgement_Order"]["Files"].append(file_info)
                 
                 # Keep backward compatibility - use first file
                 case_data["Judgement_Order"]["File"] = judgment_files[0]['href']
                 case_data["Judgement_Order"]["Type"] = "PDF"
-                case_data["Judgement_Order"]["Downloaded_Path"] = case_data["Judgement_Order"]["Files"][0]["Downloaded_Path"]
             
             # Extract history
-            history_span = soup.find('span', {'id': 'spnNotFound'})
-            if history_span and 'No Fixation History Found' in history_span.get_text():
+            history_span = tree.get_element_by_id('spnNotFound', None)
+            if history_span is not None and 'No Fixation History Found' in history_span.text_content():
                 case_data["History"] = [{"note": "No Fixation History Found"}]
             else:
-                history_div = soup.find('div', {'id': 'divResult'})
-                if history_div:
-                    history_text = history_div.get_text(strip=True)
+                history_div = tree.get_element_by_id('divResult', None)
+                if history_div is not None:
+                    history_text = _clean_text(history_div)
                     if history_text and "No Fixation History Found" not in history_text:
                         case_data["History"].append({"note": history_text})
             
-            # Navigate back
-            driver.back()
-            time.sleep(1)
+            # Collect download results
+            for future in as_completed(pending_downloads):
+                pending_downloads[future]["Downloaded_Path"] = future.result()
             
-            # Handle potential form resubmission
-            self.handle_form_resubmission(driver)
+            for section in ("Petition_Appeal_Memo", "Judgement_Order"):
+                if case_data[section]["Files"]:
+                    case_data[section]["Downloaded_Path"] = case_data[section]["Files"][0]["Downloaded_Path"]
             
             print(f"✅ Worker {worker_id}: Case {case_index + 1} processed - {case_data['Case_No']}")
             return case_data
             
         except Exception as e:
             print(f"❌ Worker {worker_id}: Error processing case {case_index + 1} - {e}")
+            # Release the claim so another worker (or a retry) can still capture it
+            if claimed_case_no is not None:
+                with self._seen_lock:
+                    self._seen_cases.pop(claimed_case_no, None)
             try:
-                driver.back()
-                time.sleep(1)
-                self.handle_form_resubmission(driver)
+                # Recover the results grid so the next postback has a page to run on
+                self.handle_form_resubmission(driver, browser_source)
+                if not self.wait_for_results(driver, timeout=5):
+                    self.navigate_and_search(driver, worker_id)
             except:
                 pass
             return None
     
     def worker_process_cases(self, case_indices, worker_id):
-        """Worker function to process assigned cases"""
+        """Worker function to process assigned cases
+        
+        processed_cases is local to this worker and only handed back as the
+        return value; results are merged once on the main thread, so no
+        lock is needed around them.
+        """
         driver = None
         processed_cases = []
         
@@ -430,14 +679,15 @@ class MultiBrowserCALahore2025Extractor:
                 print(f"❌ Worker {worker_id}: Failed to navigate and search")
                 return []
             
+            # Reuse the scout's parsed postback targets; the grid IDs are the
+            # same for every session running the same search
+            case_targets = self.case_targets or self.get_case_targets(driver)
+            
             # Process assigned cases
             for case_index in case_indices:
-                case_data = self.extract_detailed_case_info(driver, case_index, worker_id)
+                case_data = self.extract_detailed_case_info(driver, case_index, worker_id, case_targets)
                 if case_data:
                     processed_cases.append(case_data)
-                
-                # Small delay between cases
-                time.sleep(0.5)
             
             print(f"✅ Worker {worker_id}: Completed processing {len(processed_cases)} cases")
             return processed_cases
@@ -466,9 +716,9 @@ class MultiBrowserCALahore2025Extractor:
             if not self.navigate_and_search(driver, "scout"):
                 return 0
             
-            # Count View Details links
-            view_details_links = driver.find_elements(By.XPATH, "//a[contains(text(), 'View Details')]")
-            total_cases = len(view_details_links)
+            # Parse the result list once and share the targets with all workers
+            self.case_targets = self.get_case_targets(driver)
+            total_cases = len(self.case_targets)
             
             print(f"📋 Total cases found: {total_cases}")
             return total_cases
@@ -485,28 +735,23 @@ class MultiBrowserCALahore2025Extractor:
                     pass
     
     def distribute_cases(self, total_cases):
-        """Distribute cases among workers"""
+        """Distribute cases among workers round-robin so they finish at similar times"""
         if total_cases == 0:
             return []
         
-        cases_per_worker = max(1, total_cases // self.max_workers)
         worker_assignments = []
         
+        # Worker i gets cases i, i+W, i+2W, ... so slow and fast stretches of
+        # the result list are spread evenly instead of landing on one worker
         for i in range(self.max_workers):
-            start_idx = i * cases_per_worker
-            if i == self.max_workers - 1:  # Last worker gets remaining cases
-                end_idx = total_cases
-            else:
-                end_idx = (i + 1) * cases_per_worker
-            
-            if start_idx < total_cases:
-                case_indices = list(range(start_idx, end_idx))
+            case_indices = list(range(i, total_cases, self.max_workers))
+            if case_indices:
                 worker_assignments.append((case_indices, i + 1))
         
         # Print distribution
         print(f"📊 Case Distribution:")
         for case_indices, worker_id in worker_assignments:
-            print(f"   Worker {worker_id}: Cases {case_indices[0]+1}-{case_indices[-1]+1} ({len(case_indices)} cases)")
+            print(f"   Worker {worker_id}: Cases {case_indices[0]+1}, {case_indices[0]+1+self.max_workers}, ... ({len(case_indices)} cases)")
         
         return worker_assignments
     
@@ -518,8 +763,10 @@ class MultiBrowserCALahore2025Extractor:
         start_time = time.time()
         
         try:
-            # Get total cases count
-            total_cases = self.get_total_cases_count()
+            # Get total cases count - plain HTTP first, Chrome scout only as fallback
+            total_cases, self.case_targets = self.scout_with_requests()
+            if total_cases == 0:
+                total_cases = self.get_total_cases_count()
             if total_cases == 0:
                 print("❌ No cases found to process")
                 return False
@@ -532,12 +779,22 @@ class MultiBrowserCALahore2025Extractor:
             
             print(f"\n🏁 Starting parallel extraction with {len(worker_assignments)} workers...")
             
-            # Run parallel extraction
-            all_results = []
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Shared seen-case registry for incremental dedup across processes
+            mp_context = multiprocessing.get_context('spawn')
+            manager = mp_context.Manager()
+            seen_cases = manager.dict()
+            seen_lock = manager.Lock()
+            
+            # Run parallel extraction - each worker returns its own list
+            worker_results_lists = []
+            # Workers run in separate processes so their BeautifulSoup parsing is
+            # not serialized by the GIL; only plain data crosses the boundary
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=mp_context) as executor:
                 # Submit all worker tasks
                 future_to_worker = {
-                    executor.submit(self.worker_process_cases, case_indices, worker_id): worker_id
+                    executor.submit(run_worker_process, case_indices, worker_id,
+                                    self.case_targets, self.max_workers, self.download_pdfs,
+                                    seen_cases, seen_lock): worker_id
                     for case_indices, worker_id in worker_assignments
                 }
                 
@@ -546,12 +803,14 @@ class MultiBrowserCALahore2025Extractor:
                     worker_id = future_to_worker[future]
                     try:
                         worker_results = future.result()
-                        all_results.extend(worker_results)
+                        worker_results_lists.append(worker_results)
                         print(f"✅ Worker {worker_id} completed: {len(worker_results)} cases")
                     except Exception as e:
                         print(f"❌ Worker {worker_id} failed: {e}")
             
-            self.extracted_cases = all_results
+            # Single concatenation once all workers are done
+            self.extracted_cases = [case for worker_results in worker_results_lists for case in worker_results]
+            manager.shutdown()
             
             end_time = time.time()
             duration = end_time - start_time
@@ -567,26 +826,30 @@ class MultiBrowserCALahore2025Extractor:
         except Exception as e:
             print(f"❌ Parallel extraction failed: {e}")
             return False
+        
+        finally:
+            self.download_pool.shutdown(wait=True)
     
     def save_results(self, filename="ca_lahore_2025_links_only_results.json"):
         """Save results to JSON file"""
         try:
-            # Remove duplicates based on Case_No
-            seen_cases = set()
-            unique_cases = []
-            
-            for case in self.extracted_cases:
-                case_no = case.get("Case_No", "")
-                if case_no and case_no != "N/A" and case_no not in seen_cases:
-                    seen_cases.add(case_no)
-                    unique_cases.append(case)
+            # Duplicates are already dropped by the workers; only keep cases
+            # whose number was actually read
+            unique_cases = [
+                case for case in self.extracted_cases
+                if case.get("Case_No", "") not in ("", "N/A")
+            ]
             
             # Sort by case number for consistency
             unique_cases.sort(key=lambda x: x.get("Case_No", ""))
             
-            # Save to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(unique_cases, f, indent=2, ensure_ascii=False)
+            # Save to file (orjson writes UTF-8 bytes, same output as ensure_ascii=False)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(unique_cases, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(unique_cases, f, indent=2, ensure_ascii=False)
             
             print(f"✅ Saved {len(unique_cases)} unique cases to {filename}")
             
@@ -604,12 +867,15 @@ class MultiBrowserCALahore2025Extractor:
                     memo_path = case.get('Petition_Appeal_Memo', {}).get('Downloaded_Path', '')
                     judgment_path = case.get('Judgement_Order', {}).get('Downloaded_Path', '')
                     
-                    if memo_path and memo_path != 'No PDF Available' and 'PDF Link Available' in memo_path:
+                    memo_found = self.has_pdf(memo_path)
+                    judgment_found = self.has_pdf(judgment_path)
+                    
+                    if memo_found:
                         memo_pdfs += 1
-                    if judgment_path and judgment_path != 'No PDF Available' and 'PDF Link Available' in judgment_path:
+                    if judgment_found:
                         judgment_pdfs += 1
                     
-                    if 'PDF Link Available' in memo_path or 'PDF Link Available' in judgment_path:
+                    if memo_found or judgment_found:
                         pdf_count += 1
                 
                 print(f"   Cases with PDF Links: {pdf_count}")
@@ -627,8 +893,8 @@ class MultiBrowserCALahore2025Extractor:
                     memo_path = case.get('Petition_Appeal_Memo', {}).get('Downloaded_Path', 'N/A')
                     judgment_path = case.get('Judgement_Order', {}).get('Downloaded_Path', 'N/A')
                     
-                    print(f"      Memo PDF Link: {'✅' if 'PDF Link Available' in memo_path else '❌'}")
-                    print(f"      Judgment PDF Link: {'✅' if 'PDF Link Available' in judgment_path else '❌'}")
+                    print(f"      Memo PDF Link: {'✅' if self.has_pdf(memo_path) else '❌'}")
+                    print(f"      Judgment PDF Link: {'✅' if self.has_pdf(judgment_path) else '❌'}")
             
             return True
             
@@ -637,6 +903,20 @@ class MultiBrowserCALahore2025Extractor:
             return False
 
 
+def run_worker_process(case_indices, worker_id, case_targets, max_workers, download_pdfs,
+                       seen_cases=None, seen_lock=None):
+    """Process entry point: build a local extractor and run one worker's share of cases"""
+    extractor = MultiBrowserCALahore2025Extractor(max_workers=max_workers, download_pdfs=download_pdfs)
+    extractor.case_targets = case_targets
+    if seen_cases is not None:
+        extractor._seen_cases = seen_cases
+        extractor._seen_lock = seen_lock
+    try:
+        return extractor.worker_process_cases(case_indices, worker_id)
+    finally:
+        extractor.download_pool.shutdown(wait=True)
+
+
 def main():
     """Main function"""
     # Create extractor with 4 workers for optimal performance
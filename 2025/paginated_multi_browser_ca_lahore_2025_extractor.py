@@ -7,8 +7,11 @@ import time
 import re
 import json
 import os
+import shutil
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -16,23 +19,227 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from operator import itemgetter
+from collections import Counter
+from itertools import count
 import threading
-from queue import Queue
+from queue import LifoQueue, Empty
+
+# orjson is much faster for the result files; fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams cases out of a large results file; fall back to json.load without it
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+SEARCH_URL = "https://scp.gov.pk/OnlineCaseInformation.aspx"
+SEARCH_FORM = {
+    'ddlCaseType': '1',   # C.A.
+    'ddlRegistry': 'L',   # Lahore
+    'ddlYear': '2025',
+}
+
+# Postback control of the results grid's pager (event argument is 'Page$N')
+PAGER_TARGET = 'gvCases'
+
+# Result pages for the search above at the time of the pagination analysis;
+# only used when the live count cannot be read
+KNOWN_TOTAL_PAGES = 6
+
+# Locators for the per-case links and the pager links on a results page
+VIEW_DETAILS_XPATH = "//a[contains(text(), 'View Details')]"
+PAGER_LINKS_XPATH = "//a[contains(@href, 'Page$')]"
+
+# Ids of every detail-page element the case parse reads
+DETAIL_FIELD_IDS = frozenset((
+    'spCaseNo', 'spCaseTitle', 'spStatus', 'spInstDate',
+    'spDispDate', 'spAOR', 'spnNotFound', 'divResult',
+))
+
+# Detail spans copied as-is into the case record: (element id, case key)
+SIMPLE_FIELDS = (
+    ('spCaseNo', 'Case_No'),
+    ('spCaseTitle', 'Case_Title'),
+    ('spStatus', 'Status'),
+    ('spInstDate', 'Institution_Date'),
+    ('spDispDate', 'Disposal_Date'),
+)
+
+# True when the browser shows Chrome's form resubmission / ERR_CACHE_MISS page
+RESUBMISSION_CHECK_SCRIPT = (
+    "return /confirm form resubmission|err_cache_miss|resubmit/i"
+    ".test(document.documentElement.innerHTML);"
+)
+
+# Browser-side equivalent of parse_case_html: returns [{id: text}, [[text, href], ...]]
+# for the case details block. innerText only for the AOR span, so its <br>s come
+# back as newlines; everything else uses textContent like lxml's text_content()
+DETAIL_SCRIPT = """
+var root = document.getElementById('divCaseDetails') || document;
+var fields = {};
+arguments[0].forEach(function (id) {
+    var el = document.getElementById(id);
+    if (el && root.contains(el)) {
+        fields[id] = id === 'spAOR' ? el.innerText : el.textContent;
+    }
+});
+var links = [];
+root.querySelectorAll('a[href]').forEach(function (a) {
+    var href = a.getAttribute('href');
+    if (href) {
+        links.push([a.textContent.trim(), href]);
+    }
+});
+return [fields, links];
+"""
+
+# Extracts (event target, event argument) from a javascript:__doPostBack(...) href
+POSTBACK_RE = re.compile(r"__doPostBack\('([^']*)','([^']*)'\)")
+
+# Precompiled patterns for the per-case parse loop
+_SAFE_NAME_RE = re.compile(r'[^\w\-_.]')
+_JUDG_RE = re.compile(r'judgment|order')
+
+# Stands in for spAOR's <br> tags while its text is read (a private-use
+# character, so it cannot clash with page text)
+_BR_MARK = '\ue000'
+
+# Downloaded_Path marker for a case section without a PDF, prefixes that
+# mark a failed download, and a shared read-only stand-in for missing sub-dicts
+NO_PDF = 'No PDF Available'
+FAILED_PREFIXES = ('Download Failed', 'Download Error')
+EMPTY = {}
+
+# Outcome of a Downloaded_Path value, see classify_path
+PDF_OK, PDF_NONE, PDF_FAILED = 0, 1, 2
+
+# (connect, read) timeout for every HTTP call: fail fast on a dead socket,
+# but give large PDFs time to stream
+HTTP_TIMEOUT = (5, 30)
+
+# Detail pages fetched at once per page worker (like working several tabs)
+DETAIL_FETCH_CONCURRENCY = 4
+# Download tasks allowed in flight while the results JSON is still being read
+MAX_PENDING_DOWNLOADS = 128
+
+
+def classify_path(path):
+    """Classify a Downloaded_Path value as PDF_OK, PDF_NONE or PDF_FAILED in one pass"""
+    if not path or path == NO_PDF:
+        return PDF_NONE
+    if path.startswith(FAILED_PREFIXES):
+        return PDF_FAILED
+    return PDF_OK
+
+
+def parse_case_html(page_source):
+    """Parse a detail page into ({element id: text} for DETAIL_FIELD_IDS,
+    [(text, href) of every link]), read from the case details block only.
+    Plain strings out, so it can run on any thread"""
+    # The case details block sits after the viewstate and the results grid, near
+    # the end of the page: build the tree from there on only (the whole page
+    # when the block is missing), then collect the field texts and links in a
+    # single walk of the block
+    start = page_source.find('id="divCaseDetails"')
+    if start != -1:
+        page_source = page_source[page_source.rfind('<', 0, start):]
+    tree = lxml.html.fromstring(page_source)
+    details = tree.get_element_by_id('divCaseDetails', tree)
+    fields = {}
+    links = []
+    for el in details.iter('span', 'div', 'a'):
+        if el.tag == 'a':
+            href = el.get('href')
+            if href:
+                links.append((el.text_content().strip(), href))
+        elif el.get('id') in DETAIL_FIELD_IDS:
+            if el.get('id') == 'spAOR':
+                # One advocate per line: mark each <br> and read the span's text
+                # directly instead of re-serializing its HTML. Whitespace inside a
+                # line (source newlines, indentation) is collapsed, so a name
+                # wrapped across source lines stays on one line with its role
+                for br in el.iter('br'):
+                    br.tail = _BR_MARK + (br.tail or '')
+                lines = (' '.join(part.split()) for part in el.text_content().split(_BR_MARK))
+                fields['spAOR'] = '\n'.join(line for line in lines if line)
+            else:
+                fields[el.get('id')] = el.text_content()
+    return fields, links
+
 
 class PaginatedMultiBrowserCALahore2025Extractor:
     """High-speed extractor using multiple browser instances across all pages"""
     
-    def __init__(self, max_workers=4):
+    def __init__(self, max_workers=4, download_concurrency=None):
         self.max_workers = max_workers
+        
+        # Number of PDFs downloaded at once (defaults to 4 per worker)
+        self.download_concurrency = download_concurrency or max_workers * 4
         self.extracted_cases = []
         self.base_url = "https://scp.gov.pk"
-        self.results_lock = threading.Lock()
+        
+        # Each finished page is written here as NDJSON straight away, so cases
+        # are not only held in memory until the very end of the run
+        self.results_dir = "ca_lahore_2025_all_pages_results"
+        
+        # Pool of reusable browsers shared by the page workers, and the results
+        # page each pooled browser is currently showing (None = not searched yet).
+        # LIFO so the most recently used (already searched) browser goes out first
+        self._driver_pool = LifoQueue()
+        self._driver_page = {}
+        
+        # Every browser started gets the next profile slot. Slots are reused
+        # run after run, so each browser starts with a warm HTTP disk cache
+        # for the site's scripts and styles
+        self.profiles_dir = "ca_lahore_2025_chrome_profiles"
+        self._profile_slots = count(1)
+        
+        # Page 1 results state (form fields, cookies, case targets) captured by
+        # the one search of the run; other pages are paged to from it over HTTP
+        self._search_state = None
+        
+        # Pooled HTTP session for all HTTP work (View Details postbacks and PDF
+        # downloads). Transient 5xx and connection resets are retried here;
+        # the postbacks only read data, so POST is safe to retry too
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset(('GET', 'POST')))
+        # One keep-alive pool for the host, sized for every thread that can use it
+        # at once: the download pool plus each page worker's detail fetches
+        adapter = HTTPAdapter(pool_connections=max_workers,
+                              pool_maxsize=self.download_concurrency + max_workers * DETAIL_FETCH_CONCURRENCY,
+                              max_retries=retries)
+        # Mounted for both schemes so PDF links given as plain http:// share the
+        # same pool and retry policy
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.verify = False
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        
+        # Shared pool for PDF downloads so all files of a case transfer at once
+        self.download_pool = ThreadPoolExecutor(max_workers=self.download_concurrency)
+        
+        # One queue of View Details postbacks for all pages: a page whose fetches
+        # finish early frees its threads for the pages still being fetched
+        self.detail_pool = ThreadPoolExecutor(max_workers=max_workers * DETAIL_FETCH_CONCURRENCY)
+        
+        # PDF URL -> local file already downloaded, so cases that share a
+        # document (e.g. a common judgment) link to it instead of refetching
+        self._pdf_url_cache = {}
+        self._pdf_lock = threading.Lock()
         
         # Create downloads directory (actual downloads now)
         self.downloads_dir = "ca_lahore_2025_all_pages_pdfs"
@@ -40,14 +247,49 @@ class PaginatedMultiBrowserCALahore2025Extractor:
         
         print(f"✅ Paginated Multi-Browser C.A. Lahore 2025 Extractor initialized with {max_workers} workers")
     
-    def create_optimized_driver(self, headless=False):
-        """Create optimized Chrome WebDriver for speed"""
+    def clear_profile_locks(self, profile_dir):
+        """Remove Chrome's Singleton* lock files left in a profile by a crashed
+        run, so the slot can be launched again. A lock whose Chrome is still
+        running (another run overlapping this one) is left alone"""
+        try:
+            entries = list(os.scandir(profile_dir))
+        except FileNotFoundError:
+            return
+        
+        # On POSIX SingletonLock is a symlink to "<host>-<pid>" of the owner
+        try:
+            owner_pid = int(os.readlink(os.path.join(profile_dir, 'SingletonLock')).rsplit('-', 1)[1])
+            os.kill(owner_pid, 0)
+            return
+        except (OSError, ValueError, IndexError):
+            pass
+        
+        for entry in entries:
+            if entry.name.startswith('Singleton'):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    def create_optimized_driver(self, headless=True, profile_slot=None):
+        """Create optimized Chrome WebDriver for speed (profile_slot: keep a
+        persistent profile and disk cache under profiles_dir)"""
         try:
             options = Options()
             
+            # Persistent profile; Chrome locks it, so each live browser needs its own
+            if profile_slot is not None:
+                profile_dir = os.path.abspath(os.path.join(self.profiles_dir, f"browser_{profile_slot}"))
+                self.clear_profile_locks(profile_dir)
+                options.add_argument(f'--user-data-dir={profile_dir}')
+                options.add_argument('--disk-cache-size=104857600')  # 100MB
+            
             # Performance optimizations - keep JavaScript enabled for functionality
             if headless:
-                options.add_argument('--headless')
+                # New headless mode: no window, no compositor, no GPU process
+                options.add_argument('--headless=new')
+                options.add_argument('--disable-gpu')
+                options.add_argument('--window-size=1920,1080')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-extensions')
@@ -74,9 +316,12 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             options.add_argument('--max_old_space_size=4096')
             
             # Network optimizations
-            options.add_argument('--aggressive-cache-discard')
             options.add_argument('--disable-background-networking')
             
+            # Page load strategy for faster loading: return once the DOM is ready;
+            # every step that needs an element waits for it explicitly
+            options.page_load_strategy = 'eager'
+            
             # Add prefs to disable images and other resources
             prefs = {
                 "profile.managed_default_content_settings.images": 2,
@@ -87,19 +332,71 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             options.add_experimental_option("prefs", prefs)
             
             driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(30)
-            driver.implicitly_wait(5)
+            driver.set_page_load_timeout(15)
+            # No implicit wait: every lookup that can race the page is covered
+            # by an explicit WebDriverWait, and misses should return immediately
+            driver.implicitly_wait(0)
             
             return driver
         except Exception as e:
             print(f"❌ Failed to create driver: {e}")
             return None
     
-    def navigate_to_page(self, driver, page_number, worker_id):
+    def borrow_driver(self):
+        """Take a browser from the pool, starting a new one only if none is free.
+        At most one browser per worker thread is ever started"""
+        try:
+            return self._driver_pool.get_nowait()
+        except Empty:
+            driver = self.create_optimized_driver(profile_slot=next(self._profile_slots))
+            if driver:
+                self._driver_page[driver.session_id] = None
+            return driver
+    
+    def acquire_page_driver(self, page_number, worker_id):
+        """Borrow a browser and bring it to the given results page; None on failure"""
+        driver = self.borrow_driver()
+        if not driver:
+            print(f"❌ Worker {worker_id}: Failed to create driver")
+            return None
+        
+        current_page = self._driver_page.get(driver.session_id)
+        
+        # Only search if this browser has no results loaded yet; otherwise
+        # page straight from where the previous page left it
+        if current_page is None:
+            if not self.navigate_and_search(driver, worker_id):
+                print(f"❌ Worker {worker_id}: Failed to navigate and search")
+                self._driver_pool.put(driver)
+                return None
+            current_page = 1
+            self._driver_page[driver.session_id] = current_page
+        
+        # Navigate to the assigned page
+        if not self.navigate_to_page(driver, page_number, worker_id, current_page):
+            print(f"❌ Worker {worker_id}: Failed to navigate to page {page_number}")
+            self._driver_page[driver.session_id] = None
+            self._driver_pool.put(driver)
+            return None
+        
+        self._driver_page[driver.session_id] = page_number
+        return driver
+    
+    def close_driver_pool(self):
+        """Quit every pooled browser"""
+        while not self._driver_pool.empty():
+            driver = self._driver_pool.get()
+            try:
+                driver.quit()
+            except:
+                pass
+        self._driver_page.clear()
+    
+    def navigate_to_page(self, driver, page_number, worker_id, current_page=1):
         """Navigate to a specific page"""
         try:
-            if page_number == 1:
-                # Already on page 1 after search
+            if page_number == current_page:
+                # Already showing this page
                 return True
             
             print(f"🔄 Worker {worker_id}: Navigating to page {page_number}")
@@ -108,8 +405,15 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             page_link = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, f"//a[text()='{page_number}']"))
             )
+            old_first_row = driver.find_element(By.XPATH, VIEW_DETAILS_XPATH)
             driver.execute_script("arguments[0].click();", page_link)
-            time.sleep(3)
+            
+            # The pager postback replaces the grid: continue as soon as the old
+            # rows are gone and the new page's rows are in
+            WebDriverWait(driver, 10).until(EC.staleness_of(old_first_row))
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, VIEW_DETAILS_XPATH))
+            )
             
             print(f"✅ Worker {worker_id}: Successfully navigated to page {page_number}")
             return True
@@ -121,49 +425,27 @@ class PaginatedMultiBrowserCALahore2025Extractor:
     def navigate_and_search(self, driver, worker_id):
         """Navigate to website and perform search for a worker"""
         try:
-            url = "https://scp.gov.pk/OnlineCaseInformation.aspx"
             print(f"🌐 Worker {worker_id}: Navigating to website")
-            driver.get(url)
-            time.sleep(3)
+            driver.get(SEARCH_URL)
             
-            # Wait for page to load completely
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "ddlCaseType"))
-            )
-            
-            # Select case type: C.A.
-            case_type_select = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, 'ddlCaseType'))
-            )
-            select = Select(case_type_select)
-            select.select_by_value('1')  # C.A.
-            time.sleep(1)
-            
-            # Select registry: Lahore
-            registry_select = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, 'ddlRegistry'))
-            )
-            select = Select(registry_select)
-            select.select_by_value('L')  # Lahore
-            time.sleep(1)
-            
-            # Select year: 2025
-            year_select = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, 'ddlYear'))
-            )
-            select = Select(year_select)
-            select.select_by_value('2025')
-            time.sleep(1)
-            
-            # Click search button with better handling
+            # Wait once for the search button: the dropdowns come before it in
+            # the same form, so they are ready to use by then
             search_button = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.ID, 'btnSearch'))
             )
-            driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-            time.sleep(1)
+            
+            # Select case type (C.A.), registry (Lahore) and year (2025)
+            for field_id, value in SEARCH_FORM.items():
+                Select(driver.find_element(By.ID, field_id)).select_by_value(value)
+            
+            # Click search button (a JS click needs no scrolling into view)
             driver.execute_script("arguments[0].click();", search_button)
             print(f"🔍 Worker {worker_id}: Search button clicked")
-            time.sleep(5)
+            
+            # Proceed as soon as the results list is rendered
+            if not self.wait_for_results(driver):
+                print(f"❌ Worker {worker_id}: No results appeared after search")
+                return False
             
             print(f"✅ Worker {worker_id}: Search completed")
             return True
@@ -175,25 +457,170 @@ class PaginatedMultiBrowserCALahore2025Extractor:
     def handle_form_resubmission(self, driver):
         """Handle form resubmission error"""
         try:
-            page_source = driver.page_source.lower()
+            # Fast path: the search form or a case detail is rendered, so the
+            # page is healthy (one lookup for both)
+            if driver.find_elements(By.CSS_SELECTOR, '#ddlCaseType, #spCaseNo'):
+                return False
             
-            if ("confirm form resubmission" in page_source or 
-                "err_cache_miss" in page_source or
-                "resubmit" in page_source):
-                
+            # Look for the resubmission error text in the browser; only the
+            # answer comes back, not the whole page_source
+            if driver.execute_script(RESUBMISSION_CHECK_SCRIPT):
                 driver.refresh()
-                time.sleep(2)
+                self.wait_for_results(driver, timeout=5)
                 return True
             
             return False
         except Exception as e:
             return False
     
+    def wait_for_results(self, driver, timeout=10):
+        """Wait until the View Details links of the results list are present"""
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, VIEW_DETAILS_XPATH))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def capture_page_state(self, driver):
+        """Read the browser's current results page once (see parse_page_state)"""
+        cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+        return self.parse_page_state(driver.page_source, cookies)
+    
+    def parse_page_state(self, html, cookies):
+        """ASP.NET hidden fields, search values and the (event target, event argument)
+        of every View Details link of a results page"""
+        tree = lxml.html.fromstring(html)
+        
+        form_state = {
+            field.get('name'): field.get('value', '')
+            for field in tree.xpath("//input[@type='hidden'][@name]")
+        }
+        form_state.update(SEARCH_FORM)
+        
+        case_targets = []
+        for link in tree.xpath("//a[@href][normalize-space()='View Details']"):
+            match = POSTBACK_RE.search(link.get('href'))
+            case_targets.append(match.groups() if match else None)
+        
+        # Pager links for every page but the current one
+        total_pages = len(tree.xpath(PAGER_LINKS_XPATH)) + 1
+        
+        return {'form': form_state, 'cookies': cookies, 'targets': case_targets, 'pages': total_pages}
+    
+    def search_over_http(self):
+        """Load the search form and submit the search over HTTP; returns the
+        page 1 state, or None when the browser has to search"""
+        try:
+            response = self.session.get(SEARCH_URL, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            
+            # Post the form back exactly as the browser would, with the search
+            # values and the Search button as the submitter
+            form = lxml.html.fromstring(response.text).forms[0]
+            form_data = dict(form.form_values())
+            form_data.update(SEARCH_FORM)
+            form_data['btnSearch'] = 'Search'
+            
+            response = self.session.post(SEARCH_URL, data=form_data, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200 or 'View Details' not in response.text:
+                return None
+            
+            page_state = self.parse_page_state(response.text, self.session.cookies.get_dict())
+            if not page_state['targets']:
+                return None
+            return page_state
+        except (requests.exceptions.RequestException, IndexError):
+            return None
+    
+    def fetch_results_page_state(self, page_number):
+        """Page from the cached search state to page_number over HTTP; returns the
+        page's state or None when the browser has to be used"""
+        if not self._search_state:
+            return None
+        if page_number == 1:
+            return self._search_state
+        try:
+            form_data = dict(self._search_state['form'])
+            form_data['__EVENTTARGET'] = PAGER_TARGET
+            form_data['__EVENTARGUMENT'] = f"Page${page_number}"
+            
+            response = self.session.post(SEARCH_URL, data=form_data,
+                                         cookies=self._search_state['cookies'], timeout=HTTP_TIMEOUT)
+            if response.status_code == 200 and 'View Details' in response.text:
+                page_state = self.parse_page_state(response.text, self._search_state['cookies'])
+                if page_state['targets']:
+                    return page_state
+        except requests.exceptions.RequestException:
+            pass
+        
+        return None
+    
+    def fetch_detail_html(self, page_state, case_index):
+        """Replay a View Details postback over HTTP; returns the detail HTML or None"""
+        if not page_state or case_index >= len(page_state['targets']):
+            return None
+        target = page_state['targets'][case_index]
+        if not target:
+            return None
+        try:
+            form_data = dict(page_state['form'])
+            form_data['__EVENTTARGET'], form_data['__EVENTARGUMENT'] = target
+            
+            # Send this browser's own cookies so the postback runs in its session
+            response = self.session.post(SEARCH_URL, data=form_data,
+                                         cookies=page_state['cookies'], timeout=HTTP_TIMEOUT)
+            if response.status_code == 200 and 'id="spCaseNo"' in response.text:
+                return response.text
+        except requests.exceptions.RequestException:
+            pass
+        
+        # Viewstate rejected or the request failed - let the caller use the browser
+        return None
+    
+    def stream_pdf(self, pdf_url, local_path):
+        """Stream a PDF to local_path over the shared session; returns its size in bytes"""
+        part_path = local_path + '.part'
+        
+        # Resume a .part file left by an interrupted run with a Range request
+        try:
+            size = os.path.getsize(part_path)
+        except OSError:
+            size = 0
+        headers = {'Range': f'bytes={size}-'} if size else None
+        
+        with self.session.get(pdf_url, timeout=HTTP_TIMEOUT, stream=True, headers=headers) as response:
+            if response.status_code == 416:
+                # The .part does not fit the remote file - drop it and start over
+                os.remove(part_path)
+                return self.stream_pdf(pdf_url, local_path)
+            response.raise_for_status()
+            
+            # Append only if the server honoured the range; a plain 200 means
+            # the whole file is coming again, so start the .part over
+            mode = 'ab'
+            if response.status_code != 206 or not response.headers.get('Content-Range', '').startswith(f'bytes {size}-'):
+                mode = 'wb'
+                size = 0
+            
+            # Read the socket in 64KB chunks (never response.content, which
+            # would hold the whole PDF) into a 1MB write buffer
+            with open(part_path, mode, buffering=1024 * 1024) as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+                    size += len(chunk)
+        
+        # Only a complete download gets the final name, so an interrupted
+        # run never leaves a truncated PDF that the exists check would skip
+        os.replace(part_path, local_path)
+        return size
+    
     def download_pdf(self, pdf_url, case_no, pdf_type, worker_id):
         """Download PDF files and return local path"""
         try:
             if not pdf_url or pdf_url == "N/A" or "not available" in pdf_url.lower():
-                return "No PDF Available"
+                return NO_PDF
             
             # Make URL absolute if relative
             if pdf_url.startswith('/'):
@@ -203,30 +630,36 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             os.makedirs(self.downloads_dir, exist_ok=True)
             
             # Generate safe filename
-            safe_case_no = re.sub(r'[^\w\-_.]', '_', case_no)
+            safe_case_no = _SAFE_NAME_RE.sub('_', case_no)
             filename = f"{safe_case_no}_{pdf_type}.pdf"
             local_path = os.path.join(self.downloads_dir, filename)
             
             # Skip if file already exists
-            if os.path.exists(local_path):
+            if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
                 print(f"📄 Worker {worker_id}: PDF already exists - {filename}")
                 return local_path
             
-            # Download the PDF
-            print(f"⬇️ Worker {worker_id}: Downloading {filename}")
+            # Same document already fetched for another case: hardlink it (copy
+            # where hardlinks are not supported)
+            with self._pdf_lock:
+                cached_path = self._pdf_url_cache.get(pdf_url)
+            if cached_path and os.path.exists(cached_path):
+                try:
+                    os.link(cached_path, local_path)
+                except OSError:
+                    shutil.copyfile(cached_path, local_path)
+                print(f"🔗 Worker {worker_id}: Reused {os.path.basename(cached_path)} for {filename}")
+                return local_path
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            # Download the PDF over the shared keep-alive session
+            print(f"⬇️ Worker {worker_id}: Downloading {filename}")
             
-            response = requests.get(pdf_url, headers=headers, verify=False, timeout=30)
-            response.raise_for_status()
+            size = self.stream_pdf(pdf_url, local_path)
             
-            # Save the PDF
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+            with self._pdf_lock:
+                self._pdf_url_cache[pdf_url] = local_path
             
-            print(f"✅ Worker {worker_id}: Downloaded {filename} ({len(response.content)} bytes)")
+            print(f"✅ Worker {worker_id}: Downloaded {filename} ({size} bytes)")
             return local_path
             
         except requests.exceptions.RequestException as e:
@@ -236,27 +669,55 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             print(f"❌ Worker {worker_id}: Error downloading {case_no} - {e}")
             return f"Download Error: {str(e)}"
     
-    def extract_detailed_case_info(self, driver, case_index, worker_id, page_number):
-        """Extract detailed case information for a specific case"""
+    def fetch_case_details(self, page_state, case_index):
+        """Fetch a detail page over HTTP and parse it (see parse_case_html); None
+        when the browser has to be used"""
+        # Runs as a detail_pool task: a failure only sends this one case to the
+        # browser instead of raising out of the whole page's map()
+        try:
+            page_source = self.fetch_detail_html(page_state, case_index)
+            return parse_case_html(page_source) if page_source is not None else None
+        except Exception as e:
+            print(f"⚠️ HTTP detail fetch failed for case {case_index + 1} - {e}")
+            return None
+    
+    def extract_detailed_case_info(self, driver, case_index, worker_id, page_number, page_state=None, details=None,
+                                   http_tried=False):
+        """Extract detailed case information for a specific case (details: an already
+        fetched and parsed detail page; http_tried: the HTTP fetch already failed,
+        go straight to the browser)"""
         try:
             print(f"🔍 Worker {worker_id}: Processing Page {page_number}, Case {case_index + 1}")
             
-            # Get View Details links
-            view_details_links = driver.find_elements(By.XPATH, "//a[contains(text(), 'View Details')]")
-            
-            if case_index >= len(view_details_links):
-                print(f"⚠️ Worker {worker_id}: Case index {case_index} out of range on page {page_number}")
-                return None
-            
-            # Click View Details
-            link = view_details_links[case_index]
-            driver.execute_script("arguments[0].scrollIntoView(true);", link)
-            time.sleep(0.5)
-            driver.execute_script("arguments[0].click();", link)
-            time.sleep(2)
+            # Fetch the detail page over HTTP when the page state allows it
+            if details is None and not http_tried:
+                details = self.fetch_case_details(page_state, case_index)
             
-            # Extract information using BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            if details is None:
+                # View Details targets were read once for the whole page
+                case_targets = (page_state or self.capture_page_state(driver))['targets']
+                
+                if case_index >= len(case_targets) or not case_targets[case_index]:
+                    print(f"⚠️ Worker {worker_id}: Case index {case_index} out of range on page {page_number}")
+                    return None
+                
+                # Fire the stored View Details postback in the browser. The detail
+                # page still carries this page's results grid, so the next case
+                # can be opened from it without driver.back()
+                old_root = driver.find_element(By.TAG_NAME, "html")
+                driver.execute_script("__doPostBack(arguments[0], arguments[1]);", *case_targets[case_index])
+                
+                # Read the page as soon as the case details are shown
+                WebDriverWait(driver, 10).until(EC.staleness_of(old_root))
+                WebDriverWait(driver, 10).until(
+                    EC.visibility_of_element_located((By.ID, "spCaseNo"))
+                )
+                # Read the fields and links in the browser and transfer just
+                # those, instead of serializing the whole page_source
+                fields, pdf_links = driver.execute_script(DETAIL_SCRIPT, sorted(DETAIL_FIELD_IDS))
+                details = fields, [tuple(link) for link in pdf_links]
+            
+            fields, pdf_links = details
             
             # Initialize case structure
             case_data = {
@@ -268,280 +729,291 @@ class PaginatedMultiBrowserCALahore2025Extractor:
                 "Advocates": {
                     "ASC": "N/A",
                     "AOR": "N/A",
-                    "Prosecutor": "N/A"
+                    "Prosecutor": "N/A",
+                    "Other": "N/A"
                 },
                 "Petition_Appeal_Memo": {
                     "File": "N/A",
                     "Type": "N/A",
-                    "Downloaded_Path": "No PDF Available",
+                    "Downloaded_Path": NO_PDF,
                     "Files": []  # Support for multiple files
                 },
                 "History": [],
                 "Judgement_Order": {
                     "File": "N/A",
                     "Type": "N/A",
-                    "Downloaded_Path": "No PDF Available",
+                    "Downloaded_Path": NO_PDF,
                     "Files": []  # Support for multiple files
                 },
-                "Worker_ID": worker_id,
                 "Page_Number": page_number
             }
             
-            # Extract Case No from spCaseNo
-            case_no_span = soup.find('span', {'id': 'spCaseNo'})
-            if case_no_span:
-                case_data["Case_No"] = case_no_span.get_text(strip=True)
-            
-            # Extract Case Title from spCaseTitle  
-            case_title_span = soup.find('span', {'id': 'spCaseTitle'})
-            if case_title_span:
-                case_data["Case_Title"] = case_title_span.get_text(strip=True)
-            
-            # Extract Status from spStatus
-            status_span = soup.find('span', {'id': 'spStatus'})
-            if status_span:
-                case_data["Status"] = status_span.get_text(strip=True)
-            
-            # Extract Institution Date from spInstDate
-            inst_date_span = soup.find('span', {'id': 'spInstDate'})
-            if inst_date_span:
-                case_data["Institution_Date"] = inst_date_span.get_text(strip=True)
-            
-            # Extract Disposal Date from spDispDate
-            disp_date_span = soup.find('span', {'id': 'spDispDate'})
-            if disp_date_span:
-                case_data["Disposal_Date"] = disp_date_span.get_text(strip=True)
+            # Case No, title, status and dates straight from their spans
+            for span_id, key in SIMPLE_FIELDS:
+                text = fields.get(span_id)
+                if text is not None:
+                    case_data[key] = text.strip()
             
             # Extract AOR/ASC from spAOR
-            aor_span = soup.find('span', {'id': 'spAOR'})
-            if aor_span:
-                aor_html = str(aor_span)
-                
-                if '<br>' in aor_html:
-                    parts = aor_html.split('<br>')
-                    for part in parts:
-                        clean_text = re.sub(r'<[^>]+>', '', part).strip()
-                        if '(AOR)' in clean_text:
-                            case_data["Advocates"]["AOR"] = clean_text
-                        elif '(ASC)' in clean_text:
-                            case_data["Advocates"]["ASC"] = clean_text
-                        elif 'prosecutor' in clean_text.lower():
-                            case_data["Advocates"]["Prosecutor"] = clean_text
-                else:
-                    aor_text = aor_span.get_text()
-                    lines = aor_text.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if '(AOR)' in line:
-                            case_data["Advocates"]["AOR"] = line
-                        elif '(ASC)' in line:
-                            case_data["Advocates"]["ASC"] = line
-                        elif 'prosecutor' in line.lower():
-                            case_data["Advocates"]["Prosecutor"] = line
-            
-            # Enhanced PDF detection and capture
-            pdf_links = soup.find_all('a', href=True)
-            
-            # Collect all PDF files
-            memo_files = []
-            judgment_files = []
-            
-            for link in pdf_links:
-                href = link.get('href', '')
-                link_text = link.get_text(strip=True)
+            aor_text = fields.get('spAOR')
+            if aor_text is not None:
+                # One advocate per line (parse_case_html turned <br> into newlines).
+                # A case can have several counsel of one role, so every line is
+                # kept and a role's names are joined with '; '. Lines of no known
+                # role (e.g. "Additional Advocate General Punjab (-)") go to Other
+                roles = {"AOR": [], "ASC": [], "Prosecutor": [], "Other": []}
+                for line in aor_text.split('\n'):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if '(AOR)' in line:
+                        roles["AOR"].append(line)
+                    elif '(ASC)' in line:
+                        roles["ASC"].append(line)
+                    elif 'prosecutor' in line.lower():
+                        roles["Prosecutor"].append(line)
+                    else:
+                        roles["Other"].append(line)
+                advocates = case_data["Advocates"]
+                for role, names in roles.items():
+                    if names:
+                        advocates[role] = "; ".join(names)
+            
+            # Enhanced PDF detection and capture: classify each link and file it
+            # under its section in one pass. Downloads are queued on the shared
+            # pool as links are found and collected after the history parse, so
+            # all files of this case transfer concurrently
+            memo = case_data["Petition_Appeal_Memo"]
+            judgment = case_data["Judgement_Order"]
+            pending_downloads = {}
+            
+            for link_text, href in pdf_links:
+                lt = link_text.lower()
                 
                 # Enhanced detection for PDF links
-                if (href and 
-                    ('.pdf' in href.lower() or 
-                     'digital copy' in link_text.lower() or
-                     ('file' in link_text.lower() and '.pdf' in href.lower()))):
-                    
-                    # Classify PDF type based on context and text
-                    if (any(keyword in link_text.lower() for keyword in ['digital copy', 'file', 'memo', 'petition', 'appeal']) and
-                        not any(keyword in link_text.lower() for keyword in ['judgment', 'order'])):
-                        memo_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
-                    elif any(keyword in link_text.lower() for keyword in ['judgment', 'order']):
-                        judgment_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
-                    else:
-                        # Default to memo if unclear
-                        memo_files.append({
-                            'text': link_text,
-                            'href': href,
-                            'type': 'PDF'
-                        })
-            
-            # Handle memo files
-            if memo_files:
-                case_data["Petition_Appeal_Memo"]["Files"] = []
-                for i, memo_file in enumerate(memo_files):
-                    file_info = {
-                        "File": memo_file['href'],
-                        "Type": memo_file['type'], 
-                        "Description": memo_file['text'],
-                        "Downloaded_Path": "No PDF Available"
-                    }
-                    
-                    # Capture each memo PDF link
-                    link_info = self.download_pdf(
-                        memo_file['href'], 
-                        case_data["Case_No"], 
-                        f"memo_{i+1}", 
-                        worker_id
-                    )
-                    file_info["Downloaded_Path"] = link_info
-                    case_data["Petition_Appeal_Memo"]["Files"].append(file_info)
+                if '.pdf' not in href.lower() and 'digital copy' not in lt:
+                    continue
                 
-                # Keep backward compatibility - use first file
-                case_data["Petition_Appeal_Memo"]["File"] = memo_files[0]['href']
-                case_data["Petition_Appeal_Memo"]["Type"] = "PDF"
-                case_data["Petition_Appeal_Memo"]["Downloaded_Path"] = case_data["Petition_Appeal_Memo"]["Files"][0]["Downloaded_Path"]
-            
-            # Handle judgment files
-            if judgment_files:
-                case_data["Judgement_Order"]["Files"] = []
-                for i, judgment_file in enumerate(judgment_files):
-                    file_info = {
-                        "File": judgment_file['href'],
-                        "Type": judgment_file['type'],
-                        "Description": judgment_file['text'],
-                        "Downloaded_Path": "No PDF Available"
-                    }
-                    
-                    # Capture each judgment PDF link
-                    link_info = self.download_pdf(
-                        judgment_file['href'], 
-                        case_data["Case_No"], 
-                        f"judgment_{i+1}", 
-                        worker_id
-                    )
-                    file_info["Downloaded_Path"] = link_info
-                    case_data["Judgement_Order"]["Files"].append(file_info)
+                # Judgment/order links go to the judgment section, everything else
+                # (memo, petition, appeal, digital copy, unclear) to the memo section
+                if _JUDG_RE.search(lt):
+                    section, pdf_type = judgment, "judgment"
+                else:
+                    section, pdf_type = memo, "memo"
+                
+                file_info = {
+                    "File": href,
+                    "Type": "PDF",
+                    "Description": link_text,
+                    "Downloaded_Path": NO_PDF
+                }
+                section["Files"].append(file_info)
                 
-                # Keep backward compatibility - use first file
-                case_data["Judgement_Order"]["File"] = judgment_files[0]['href']
-                case_data["Judgement_Order"]["Type"] = "PDF"
-                case_data["Judgement_Order"]["Downloaded_Path"] = case_data["Judgement_Order"]["Files"][0]["Downloaded_Path"]
+                # Capture each PDF link (numbered per section: memo_1, memo_2, ...)
+                future = self.download_pool.submit(
+                    self.download_pdf,
+                    href,
+                    case_data["Case_No"],
+                    f"{pdf_type}_{len(section['Files'])}",
+                    worker_id
+                )
+                pending_downloads[future] = file_info
+            
+            # Keep backward compatibility - use first file
+            for section in (memo, judgment):
+                if section["Files"]:
+                    section["File"] = section["Files"][0]["File"]
+                    section["Type"] = "PDF"
             
             # Extract history
-            history_span = soup.find('span', {'id': 'spnNotFound'})
-            if history_span and 'No Fixation History Found' in history_span.get_text():
+            if 'No Fixation History Found' in fields.get('spnNotFound', ''):
                 case_data["History"] = [{"note": "No Fixation History Found"}]
             else:
-                history_div = soup.find('div', {'id': 'divResult'})
-                if history_div:
-                    history_text = history_div.get_text(strip=True)
+                history_text = fields.get('divResult')
+                if history_text is not None:
+                    history_text = history_text.strip()
                     if history_text and "No Fixation History Found" not in history_text:
                         case_data["History"].append({"note": history_text})
             
-            # Navigate back
-            driver.back()
-            time.sleep(1)
+            # Collect download results
+            for future in as_completed(pending_downloads):
+                pending_downloads[future]["Downloaded_Path"] = future.result()
             
-            # Handle potential form resubmission
-            self.handle_form_resubmission(driver)
+            for section in ("Petition_Appeal_Memo", "Judgement_Order"):
+                if case_data[section]["Files"]:
+                    case_data[section]["Downloaded_Path"] = case_data[section]["Files"][0]["Downloaded_Path"]
             
             print(f"✅ Worker {worker_id}: Page {page_number}, Case {case_index + 1} processed - {case_data['Case_No']}")
             return case_data
             
         except Exception as e:
             print(f"❌ Worker {worker_id}: Error processing Page {page_number}, Case {case_index + 1} - {e}")
+            if driver is None:
+                return None
             try:
-                driver.back()
-                time.sleep(1)
+                # Recover the results grid so the next postback has a page to run on
                 self.handle_form_resubmission(driver)
+                if not self.wait_for_results(driver, timeout=5):
+                    if self.navigate_and_search(driver, worker_id):
+                        self.navigate_to_page(driver, page_number, worker_id)
             except:
                 pass
             return None
     
     def worker_process_page(self, page_number, worker_id):
-        """Worker function to process all cases on a specific page"""
+        """Worker function to process all cases on a specific page; each case is
+        written to the page's results file as soon as it is extracted. Returns
+        the number of cases written"""
+        processed_count = 0
         driver = None
-        processed_cases = []
         
         try:
-            # Create optimized driver for this worker
-            driver = self.create_optimized_driver(headless=False)
-            if not driver:
-                print(f"❌ Worker {worker_id}: Failed to create driver")
-                return []
-            
-            # Navigate and search
-            if not self.navigate_and_search(driver, worker_id):
-                print(f"❌ Worker {worker_id}: Failed to navigate and search")
-                return []
-            
-            # Navigate to the assigned page
-            if not self.navigate_to_page(driver, page_number, worker_id):
-                print(f"❌ Worker {worker_id}: Failed to navigate to page {page_number}")
-                return []
+            # Page over HTTP from the scout's cached search; a browser is only
+            # brought to this page if that is not possible
+            page_state = self.fetch_results_page_state(page_number)
+            if page_state is None:
+                driver = self.acquire_page_driver(page_number, worker_id)
+                if not driver:
+                    return 0
+                
+                # Get all cases on this page, plus the form state and cookies
+                # needed to fetch their detail pages over HTTP
+                page_state = self.capture_page_state(driver)
             
-            # Get all cases on this page
-            view_details_links = driver.find_elements(By.XPATH, "//a[contains(text(), 'View Details')]")
-            total_cases_on_page = len(view_details_links)
+            total_cases_on_page = len(page_state['targets'])
             
             print(f"📋 Worker {worker_id}: Found {total_cases_on_page} cases on page {page_number}")
             
+            # Fetch and parse this page's detail pages concurrently on the shared
+            # detail pool (lxml parses without holding the GIL, so parsing runs
+            # in parallel too); only the ones that fail fall back to the
+            # (single) browser below
+            detail_pages = list(self.detail_pool.map(
+                lambda case_index: self.fetch_case_details(page_state, case_index),
+                range(total_cases_on_page)
+            ))
+            
             # Process all cases on this page
-            for case_index in range(total_cases_on_page):
-                case_data = self.extract_detailed_case_info(driver, case_index, worker_id, page_number)
-                if case_data:
-                    processed_cases.append(case_data)
-                
-                # Small delay between cases
-                time.sleep(0.5)
+            with open(self.page_results_path(page_number), 'wb') as page_file:
+                for case_index in range(total_cases_on_page):
+                    if detail_pages[case_index] is None and driver is None:
+                        # First case that needs the browser on an HTTP-paged page
+                        driver = self.acquire_page_driver(page_number, worker_id)
+                        if not driver:
+                            continue
+                    
+                    # The HTTP fetch was already tried on the detail pool
+                    case_data = self.extract_detailed_case_info(driver, case_index, worker_id, page_number,
+                                                                page_state, detail_pages[case_index],
+                                                                http_tried=True)
+                    if case_data:
+                        self.write_case_line(page_file, case_data)
+                        processed_count += 1
             
-            print(f"✅ Worker {worker_id}: Completed processing page {page_number} - {len(processed_cases)} cases")
-            return processed_cases
+            print(f"✅ Worker {worker_id}: Completed processing page {page_number} - {processed_count} cases")
+            return processed_count
             
         except Exception as e:
             print(f"❌ Worker {worker_id}: Critical error processing page {page_number} - {e}")
-            return processed_cases
+            # Unknown browser state - make the next user search again
+            if driver:
+                self._driver_page[driver.session_id] = None
+            return processed_count
         
         finally:
+            # Hand the browser back for the next page
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self._driver_pool.put(driver)
     
     def get_total_pages(self):
         """Get total number of pages available"""
-        driver = None
+        # Search over HTTP first; when that works no browser is started unless
+        # a case later needs the fallback
+        page_state = self.search_over_http()
+        if page_state:
+            self._search_state = page_state
+            print(f"📋 Total pages found: {page_state['pages']} (searched over HTTP)")
+            return page_state['pages']
+        
+        # The page workers will likely need browsers too: start and search the
+        # rest of the pool alongside the scout instead of one by one later
+        with ThreadPoolExecutor(max_workers=self.max_workers) as warmup_pool:
+            for slot in range(self.max_workers - 1):
+                warmup_pool.submit(self.warm_up_driver, f"warmup-{slot + 1}")
+            return self.scout_total_pages()
+    
+    def warm_up_driver(self, worker_id):
+        """Start a browser, search, and add it to the pool showing page 1"""
+        driver = self.create_optimized_driver(profile_slot=next(self._profile_slots))
+        if not driver:
+            return
+        searched = self.navigate_and_search(driver, worker_id)
+        self._driver_page[driver.session_id] = 1 if searched else None
+        self._driver_pool.put(driver)
+    
+    def scout_total_pages(self):
+        """Search in a pooled browser and read the page count and page 1 state"""
+        # Scout with a pooled browser; it is handed back already searched and on
+        # page 1, like the warmed-up ones, so whichever one the page 1 worker
+        # takes needs no navigation
+        driver = self.borrow_driver()
+        if not driver:
+            return 0
         try:
-            # Create temporary driver to get page count
-            driver = self.create_optimized_driver(headless=False)
-            if not driver:
-                return 0
-            
-            # Navigate and search
+            # Navigate and search - the only search of the run when the
+            # HTTP paging below works
             if not self.navigate_and_search(driver, "scout"):
                 return 0
+            self._driver_page[driver.session_id] = 1
             
-            # Count page links (we know there are 6 pages from previous analysis)
-            page_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'Page$')]")
-            total_pages = len(page_links) + 1  # +1 for current page (page 1)
+            # Cache the page 1 state; workers page from it over HTTP. The page
+            # count comes from the same read of the page
+            try:
+                self._search_state = self.capture_page_state(driver)
+                total_pages = self._search_state['pages']
+            except Exception as e:
+                self._search_state = None
+                print(f"⚠️ Scout: Could not capture search state - {e}")
+                
+                # Count page links (KNOWN_TOTAL_PAGES from previous analysis)
+                page_links = driver.find_elements(By.XPATH, PAGER_LINKS_XPATH)
+                total_pages = len(page_links) + 1  # +1 for current page (page 1)
             
             print(f"📋 Total pages found: {total_pages}")
             return total_pages
             
         except Exception as e:
             print(f"❌ Error getting page count: {e}")
-            return 6  # Fallback to known page count
+            return KNOWN_TOTAL_PAGES  # Fallback to known page count
         
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+            self._driver_pool.put(driver)
+    
+    def page_results_path(self, page_number):
+        """<results_dir>/page_<n>.ndjson: one page's cases, one JSON object per line"""
+        return os.path.join(self.results_dir, f"page_{page_number}.ndjson")
+    
+    def write_case_line(self, page_file, case):
+        """Append one case to an open page results file (binary mode) as a JSON line.
+        Flushed straight away, so an interrupted run keeps every finished case"""
+        if orjson is not None:
+            page_file.write(orjson.dumps(case) + b'\n')
+        else:
+            page_file.write(json.dumps(case, ensure_ascii=False).encode('utf-8') + b'\n')
+        page_file.flush()
+    
+    def load_page_results(self, page_numbers):
+        """Merge the per-page NDJSON files back into one list of cases"""
+        cases = []
+        for page_number in page_numbers:
+            path = self.page_results_path(page_number)
+            if not os.path.exists(path):
+                continue
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        cases.append(orjson.loads(line) if orjson is not None else json.loads(line))
+        return cases
     
     def run_parallel_extraction(self):
         """Run parallel extraction across all pages"""
@@ -563,8 +1035,14 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             pages_to_process = list(range(1, total_pages + 1))
             print(f"📊 Pages to process: {pages_to_process}")
             
+            # Drop page files left by an earlier run so they are not merged in
+            os.makedirs(self.results_dir, exist_ok=True)
+            for page_num in pages_to_process:
+                stale_path = self.page_results_path(page_num)
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
+            
             # Run parallel extraction across pages
-            all_results = []
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all page processing tasks
                 future_to_page = {
@@ -576,13 +1054,11 @@ class PaginatedMultiBrowserCALahore2025Extractor:
                 for future in as_completed(future_to_page):
                     page_num = future_to_page[future]
                     try:
-                        page_results = future.result()
-                        all_results.extend(page_results)
-                        print(f"✅ Page {page_num} completed: {len(page_results)} cases")
+                        print(f"✅ Page {page_num} completed: {future.result()} cases")
                     except Exception as e:
                         print(f"❌ Page {page_num} failed: {e}")
             
-            self.extracted_cases = all_results
+            self.extracted_cases = self.load_page_results(pages_to_process)
             
             end_time = time.time()
             duration = end_time - start_time
@@ -599,6 +1075,43 @@ class PaginatedMultiBrowserCALahore2025Extractor:
         except Exception as e:
             print(f"❌ Paginated extraction failed: {e}")
             return False
+        
+        finally:
+            self.close_driver_pool()
+            self.detail_pool.shutdown(wait=True)
+            self.download_pool.shutdown(wait=True)
+    
+    def iter_json_cases(self, json_file):
+        """Yield the cases of a results file one at a time (streamed with ijson when available)"""
+        if ijson is not None:
+            with open(json_file, 'rb') as f:
+                yield from ijson.items(f, 'item')
+        else:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                yield from json.load(f)
+    
+    def pdf_tasks_for_case(self, case):
+        """Yield a download task for every 'PDF Link Available' path of a case"""
+        case_no = case.get('Case_Number', case.get('Case_No', 'Unknown'))
+        safe_case_no = _SAFE_NAME_RE.sub('_', case_no)
+        
+        # Memo, judgment and extra PDFs (extras numbered extra_1, extra_2, ...
+        # so each gets its own file)
+        sources = [
+            ('memo', (case.get('Petition_Appeal_Memo') or EMPTY).get('Downloaded_Path', '')),
+            ('judgment', (case.get('Judgement_Order') or EMPTY).get('Downloaded_Path', '')),
+        ]
+        sources.extend((f'extra_{i}', extra_pdf.get('Downloaded_Path', ''))
+                       for i, extra_pdf in enumerate(case.get('Extra_PDFs') or (), 1))
+        
+        for pdf_type, path in sources:
+            if path and 'PDF Link Available:' in path:
+                yield {
+                    'url': path.replace('PDF Link Available: ', '').strip(),
+                    'case_no': case_no,
+                    'type': pdf_type,
+                    'filename': f"{safe_case_no}_{pdf_type}.pdf"
+                }
     
     def download_missing_pdfs_from_json(self, json_file="ca_lahore_2025_all_pages_complete.json"):
         """Download PDFs from a previously extracted JSON file"""
@@ -606,259 +1119,235 @@ class PaginatedMultiBrowserCALahore2025Extractor:
             print(f"\n📥 DOWNLOADING MISSING PDFs FROM {json_file}")
             print("=" * 60)
             
-            # Load the JSON file
-            with open(json_file, 'r', encoding='utf-8') as f:
-                cases = json.load(f)
-            
-            print(f"📋 Loaded {len(cases)} cases from {json_file}")
-            
             # Create downloads directory
             os.makedirs(self.downloads_dir, exist_ok=True)
             
-            download_tasks = []
-            
-            # Collect all PDF URLs that need downloading
-            for case in cases:
-                case_no = case.get('Case_Number', case.get('Case_No', 'Unknown'))
-                
-                # Check memo PDFs
-                memo_path = case.get('Petition_Appeal_Memo', {}).get('Downloaded_Path', '')
-                if memo_path and 'PDF Link Available:' in memo_path:
-                    pdf_url = memo_path.replace('PDF Link Available: ', '').strip()
-                    download_tasks.append({
-                        'url': pdf_url,
-                        'case_no': case_no,
-                        'type': 'memo',
-                        'case_data': case
-                    })
-                
-                # Check judgment PDFs
-                judgment_path = case.get('Judgement_Order', {}).get('Downloaded_Path', '')
-                if judgment_path and 'PDF Link Available:' in judgment_path:
-                    pdf_url = judgment_path.replace('PDF Link Available: ', '').strip()
-                    download_tasks.append({
-                        'url': pdf_url,
-                        'case_no': case_no,
-                        'type': 'judgment',
-                        'case_data': case
-                    })
-                
-                # Check extra PDFs
-                for extra_pdf in case.get('Extra_PDFs', []):
-                    extra_path = extra_pdf.get('Downloaded_Path', '')
-                    if extra_path and 'PDF Link Available:' in extra_path:
-                        pdf_url = extra_path.replace('PDF Link Available: ', '').strip()
-                        download_tasks.append({
-                            'url': pdf_url,
-                            'case_no': case_no,
-                            'type': 'extra',
-                            'case_data': case
-                        })
-            
-            print(f"🔍 Found {len(download_tasks)} PDF URLs to download")
-            
-            if not download_tasks:
-                print("ℹ️ No PDF URLs found for download")
-                return
-            
             # Download PDFs with threading
             downloaded_count = 0
             failed_count = 0
+            downloaded_bytes = 0
+            
+            # Scan the directory once instead of stat-ing every target file. Only
+            # complete, non-empty PDFs count: leftover .part files and empty
+            # files are downloaded again
+            existing_files = {name for name, size in self.pdf_disk_index().items() if size > 0}
             
             def download_single_pdf(task):
-                nonlocal downloaded_count, failed_count
-                
+                """Returns ('downloaded' | 'exists' | 'failed', bytes transferred)"""
                 try:
                     pdf_url = task['url']
-                    case_no = task['case_no']
-                    pdf_type = task['type']
-                    
-                    # Generate filename
-                    safe_case_no = re.sub(r'[^\w\-_.]', '_', case_no)
-                    filename = f"{safe_case_no}_{pdf_type}.pdf"
-                    local_path = os.path.join(self.downloads_dir, filename)
+                    filename = task['filename']
                     
-                    # Skip if already exists
-                    if os.path.exists(local_path):
+                    # Skip if already exists (checked by name, no path needed)
+                    if filename in existing_files:
                         print(f"📄 Already exists: {filename}")
-                        return local_path
+                        return 'exists', 0
                     
-                    # Download
+                    # Download over the shared session, streaming to a .part file
                     print(f"⬇️ Downloading: {filename}")
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    }
-                    
-                    response = requests.get(pdf_url, headers=headers, verify=False, timeout=30)
-                    response.raise_for_status()
+                    size = self.stream_pdf(pdf_url, os.path.join(self.downloads_dir, filename))
                     
-                    with open(local_path, 'wb') as f:
-                        f.write(response.content)
-                    
-                    downloaded_count += 1
-                    print(f"✅ Downloaded: {filename} ({len(response.content)//1024}KB)")
-                    return local_path
+                    print(f"✅ Downloaded: {filename} ({size//1024}KB)")
+                    return 'downloaded', size
                     
                 except Exception as e:
-                    failed_count += 1
                     print(f"❌ Failed: {task['case_no']} - {e}")
-                    return None
-            
-            # Process downloads in parallel
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [executor.submit(download_single_pdf, task) for task in download_tasks]
+                    return 'failed', 0
+            
+            # Process downloads in parallel. Cases are streamed out of the file
+            # and their downloads submitted as soon as each case is parsed, so
+            # transfers start before the whole file has been read. At most
+            # MAX_PENDING_DOWNLOADS tasks are queued at once; parsing waits for
+            # a slot, so memory stays flat however large the file is
+            case_count = 0
+            task_count = 0
+            
+            def completed_downloads(executor):
+                """Submit every task from the file and yield futures as they finish"""
+                nonlocal case_count, task_count
+                pending = set()
+                # Each target file is downloaded by one task only: two tasks on
+                # the same name would share (and corrupt) one .part file
+                submitted = set()
+                for case in self.iter_json_cases(json_file):
+                    case_count += 1
+                    for task in self.pdf_tasks_for_case(case):
+                        if task['filename'] in submitted:
+                            print(f"⚠️ Skipping duplicate target: {task['filename']}")
+                            continue
+                        submitted.add(task['filename'])
+                        if len(pending) >= MAX_PENDING_DOWNLOADS:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            yield from done
+                        pending.add(executor.submit(download_single_pdf, task))
+                        task_count += 1
                 
-                for future in as_completed(futures):
-                    future.result()  # Wait for completion
+                print(f"📋 Loaded {case_count} cases from {json_file}")
+                print(f"🔍 Found {task_count} PDF URLs to download")
+                yield from as_completed(pending)
+            
+            with ThreadPoolExecutor(max_workers=self.download_concurrency) as executor:
+                # Counters are updated here in the calling thread so they need no locking
+                for future in completed_downloads(executor):
+                    outcome, size = future.result()
+                    downloaded_bytes += size
+                    if outcome == 'downloaded':
+                        downloaded_count += 1
+                    elif outcome == 'failed':
+                        failed_count += 1
+            
+            if not task_count:
+                print("ℹ️ No PDF URLs found for download")
+                return
             
             print(f"\n📊 DOWNLOAD SUMMARY:")
-            print(f"   Total PDFs Found: {len(download_tasks)}")
+            print(f"   Total PDFs Found: {task_count}")
             print(f"   Successfully Downloaded: {downloaded_count}")
             print(f"   Failed Downloads: {failed_count}")
-            print(f"   Success Rate: {(downloaded_count/len(download_tasks)*100):.1f}%")
+            print(f"   Transferred This Run: {downloaded_bytes / (1024*1024):.2f} MB")
+            print(f"   Success Rate: {(downloaded_count/task_count*100):.1f}%")
             
             # Show final directory stats
             if os.path.exists(self.downloads_dir):
-                actual_files = [f for f in os.listdir(self.downloads_dir) if f.endswith('.pdf')]
-                total_size = sum(os.path.getsize(os.path.join(self.downloads_dir, f)) for f in actual_files)
-                print(f"   Total Files in Directory: {len(actual_files)}")
+                disk_index = self.pdf_disk_index()
+                total_size = sum(disk_index.values())
+                print(f"   Total Files in Directory: {len(disk_index)}")
                 print(f"   Total Size: {total_size / (1024*1024):.2f} MB")
             
         except Exception as e:
             print(f"❌ Error downloading PDFs from JSON: {e}")
 
+    def pdf_disk_index(self):
+        """Map every PDF in the downloads directory to its size, from one directory scan"""
+        disk_index = {}
+        with os.scandir(self.downloads_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.pdf') and entry.is_file():
+                    disk_index[entry.name] = entry.stat().st_size
+        return disk_index
+    
     def save_results(self, filename="ca_lahore_2025_all_pages_complete.json"):
         """Save results to JSON file"""
         try:
-            # Remove duplicates based on Case_No
-            seen_cases = set()
-            unique_cases = []
-            
-            for case in self.extracted_cases:
-                case_no = case.get("Case_No", "")
-                if case_no and case_no != "N/A" and case_no not in seen_cases:
-                    seen_cases.add(case_no)
-                    unique_cases.append(case)
+            # Remove duplicates based on Case_No in one dict pass; walking the
+            # list backwards lets the first occurrence of a case win
+            unique_by_no = {
+                case["Case_No"]: case
+                for case in reversed(self.extracted_cases)
+                if case.get("Case_No") not in (None, "", "N/A")
+            }
             
-            # Sort by case number for consistency
-            unique_cases.sort(key=lambda x: x.get("Case_No", ""))
+            # Sort by case number for consistency (every kept case has one)
+            unique_cases = sorted(unique_by_no.values(), key=itemgetter("Case_No"))
             
-            # Save to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(unique_cases, f, indent=2, ensure_ascii=False)
+            # Serialize in memory and save with a single write (orjson writes
+            # UTF-8 bytes, same output as ensure_ascii=False)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(unique_cases, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(json.dumps(unique_cases, indent=2, ensure_ascii=False))
             
             print(f"✅ Saved {len(unique_cases)} unique cases to {filename}")
             
-            # Show summary
+            # Show summary, collected into one list and printed with a single
+            # write instead of one per line
             if unique_cases:
-                print(f"\n📋 COMPLETE EXTRACTION SUMMARY:")
-                print(f"   Total Unique Cases: {len(unique_cases)}")
-                print(f"   PDF Downloads Directory: {self.downloads_dir}")
+                summary = []
+                summary.append(f"\n📋 COMPLETE EXTRACTION SUMMARY:")
+                summary.append(f"   Total Unique Cases: {len(unique_cases)}")
+                summary.append(f"   PDF Downloads Directory: {self.downloads_dir}")
                 
                 # Count by pages and PDFs
-                page_counts = {}
-                pdf_count = 0
+                page_counts = Counter()
                 memo_pdfs = 0
                 judgment_pdfs = 0
-                downloaded_pdfs = 0
-                failed_downloads = 0
+                outcome_counts = [0, 0, 0]  # indexed by PDF_OK / PDF_NONE / PDF_FAILED
+                samples = []  # first case of up to 6 pages, gathered in the same pass
                 
                 for case in unique_cases:
                     page_num = case.get('Page_Number', 'Unknown')
-                    page_counts[page_num] = page_counts.get(page_num, 0) + 1
+                    page_counts[page_num] += 1
                     
-                    memo_path = case.get('Petition_Appeal_Memo', {}).get('Downloaded_Path', '')
-                    judgment_path = case.get('Judgement_Order', {}).get('Downloaded_Path', '')
+                    # Bind both sections once for all the lookups below
+                    memo = case.get('Petition_Appeal_Memo') or EMPTY
+                    judgment = case.get('Judgement_Order') or EMPTY
+                    memo_path = memo.get('Downloaded_Path', '')
+                    judgment_path = judgment.get('Downloaded_Path', '')
                     
                     # Count memo PDFs
-                    if memo_path and memo_path != 'No PDF Available':
-                        memo_pdfs += 1
-                        if not memo_path.startswith('Download Failed') and not memo_path.startswith('Download Error'):
-                            downloaded_pdfs += 1
-                        else:
-                            failed_downloads += 1
+                    memo_outcome = classify_path(memo_path)
+                    memo_pdfs += memo_outcome != PDF_NONE
+                    outcome_counts[memo_outcome] += 1
                     
                     # Count judgment PDFs  
-                    if judgment_path and judgment_path != 'No PDF Available':
-                        judgment_pdfs += 1
-                        if not judgment_path.startswith('Download Failed') and not judgment_path.startswith('Download Error'):
-                            downloaded_pdfs += 1
-                        else:
-                            failed_downloads += 1
+                    judgment_outcome = classify_path(judgment_path)
+                    judgment_pdfs += judgment_outcome != PDF_NONE
+                    outcome_counts[judgment_outcome] += 1
                     
-                    # Count additional PDFs from Files arrays
-                    for file_info in case.get('Petition_Appeal_Memo', {}).get('Files', []):
-                        file_path = file_info.get('Downloaded_Path', '')
-                        if file_path and file_path != 'No PDF Available':
-                            if not file_path.startswith('Download Failed') and not file_path.startswith('Download Error'):
-                                downloaded_pdfs += 1
-                            else:
-                                failed_downloads += 1
+                    # A page's first case becomes a sample while slots are left
+                    if page_counts[page_num] == 1 and len(samples) < 6:
+                        samples.append((case, page_num, memo_path, memo_outcome, judgment_path, judgment_outcome))
                     
-                    for file_info in case.get('Judgement_Order', {}).get('Files', []):
-                        file_path = file_info.get('Downloaded_Path', '')
-                        if file_path and file_path != 'No PDF Available':
-                            if not file_path.startswith('Download Failed') and not file_path.startswith('Download Error'):
-                                downloaded_pdfs += 1
-                            else:
-                                failed_downloads += 1
+                    # Count additional PDFs from both Files arrays
+                    for files in (memo.get('Files') or (), judgment.get('Files') or ()):
+                        for file_info in files:
+                            outcome_counts[classify_path(file_info.get('Downloaded_Path', ''))] += 1
                 
-                print(f"   Memo PDFs Found: {memo_pdfs}")
-                print(f"   Judgment PDFs Found: {judgment_pdfs}")
-                print(f"   Successfully Downloaded: {downloaded_pdfs}")
-                print(f"   Failed Downloads: {failed_downloads}")
-                print(f"   Download Success Rate: {(downloaded_pdfs/(downloaded_pdfs+failed_downloads)*100):.1f}%" if (downloaded_pdfs+failed_downloads) > 0 else "N/A")
+                downloaded_pdfs = outcome_counts[PDF_OK]
+                failed_downloads = outcome_counts[PDF_FAILED]
+                total_attempts = downloaded_pdfs + failed_downloads
+                success_rate = f"{downloaded_pdfs * 100 / total_attempts:.1f}%" if total_attempts else "N/A"
+                summary.append(f"   Memo PDFs Found: {memo_pdfs}")
+                summary.append(f"   Judgment PDFs Found: {judgment_pdfs}")
+                summary.append(f"   Successfully Downloaded: {downloaded_pdfs}")
+                summary.append(f"   Failed Downloads: {failed_downloads}")
+                summary.append(f"   Download Success Rate: {success_rate}")
                 
-                # Check actual files in directory
+                # Check actual files in directory; the index also serves the
+                # sample status lookups below
+                disk_index = EMPTY
                 if os.path.exists(self.downloads_dir):
-                    actual_files = [f for f in os.listdir(self.downloads_dir) if f.endswith('.pdf')]
-                    print(f"   Actual PDF Files on Disk: {len(actual_files)}")
+                    disk_index = self.pdf_disk_index()
+                    summary.append(f"   Actual PDF Files on Disk: {len(disk_index)}")
                     
                     # Calculate total size
-                    total_size = 0
-                    for file in actual_files:
-                        file_path = os.path.join(self.downloads_dir, file)
-                        total_size += os.path.getsize(file_path)
+                    total_size = sum(disk_index.values())
                     
-                    print(f"   Total Downloaded Size: {total_size / (1024*1024):.2f} MB")
+                    summary.append(f"   Total Downloaded Size: {total_size / (1024*1024):.2f} MB")
                 
-                print(f"\n📄 Cases by Page:")
-                for page_num in sorted(page_counts.keys()):
-                    print(f"   Page {page_num}: {page_counts[page_num]} cases")
+                summary.append(f"\n📄 Cases by Page:")
+                for page_num, page_total in sorted(page_counts.items()):
+                    summary.append(f"   Page {page_num}: {page_total} cases")
                 
                 # Show sample cases with download status
-                print(f"\n📄 Sample Cases with PDF Download Status:")
-                pages_shown = set()
-                sample_count = 0
-                for case in unique_cases:
-                    page_num = case.get('Page_Number', 'Unknown')
-                    if page_num not in pages_shown and sample_count < 6:
-                        print(f"\n   Page {page_num} - {case.get('Case_No', 'N/A')}")
-                        print(f"      Title: {case.get('Case_Title', 'N/A')[:60]}...")
-                        
-                        memo_path = case.get('Petition_Appeal_Memo', {}).get('Downloaded_Path', 'N/A')
-                        judgment_path = case.get('Judgement_Order', {}).get('Downloaded_Path', 'N/A')
-                        
-                        # Check if files were actually downloaded
-                        memo_status = "❌"
-                        if memo_path and memo_path != 'No PDF Available':
-                            if os.path.exists(memo_path):
-                                memo_status = f"✅ ({os.path.getsize(memo_path)//1024}KB)"
-                            elif not memo_path.startswith('Download'):
-                                memo_status = "🔗 Link Only"
-                        
-                        judgment_status = "❌"
-                        if judgment_path and judgment_path != 'No PDF Available':
-                            if os.path.exists(judgment_path):
-                                judgment_status = f"✅ ({os.path.getsize(judgment_path)//1024}KB)"
-                            elif not judgment_path.startswith('Download'):
-                                judgment_status = "🔗 Link Only"
-                        
-                        print(f"      Memo PDF: {memo_status}")
-                        print(f"      Judgment PDF: {judgment_status}")
-                        
-                        pages_shown.add(page_num)
-                        sample_count += 1
+                summary.append(f"\n📄 Sample Cases with PDF Download Status:")
+                
+                downloads_dir = os.path.abspath(self.downloads_dir)
+                
+                def pdf_status(path, outcome):
+                    """Check if a file was actually downloaded, against the directory index"""
+                    if outcome != PDF_OK:
+                        return "❌"
+                    # Only local paths in the downloads directory can be on disk;
+                    # anything else (e.g. 'PDF Link Available: <url>') is a link
+                    if os.path.dirname(os.path.abspath(path)) != downloads_dir:
+                        return "🔗 Link Only"
+                    size = disk_index.get(os.path.basename(path))
+                    return "🔗 Link Only" if size is None else f"✅ ({size//1024}KB)"
+                
+                # One formatted block per sample case
+                for case, page_num, memo_path, memo_outcome, judgment_path, judgment_outcome in samples:
+                    title = case.get('Case_Title', 'N/A')
+                    summary.append(
+                        f"\n   Page {page_num} - {case.get('Case_No', 'N/A')}\n"
+                        f"      Title: {title[:60]}...\n"
+                        f"      Memo PDF: {pdf_status(memo_path, memo_outcome)}\n"
+                        f"      Judgment PDF: {pdf_status(judgment_path, judgment_outcome)}"
+                    )
+                
+                print("\n".join(summary))
             
             return True
             
@@ -8,6 +8,9 @@ import re
 import json
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -26,6 +29,16 @@ class CALahore2025Extractor:
         self.extracted_cases = []
         self.base_url = "https://scp.gov.pk"
         
+        # Keep-alive session so every PDF from scp.gov.pk reuses one connection
+        # instead of a fresh TCP+TLS handshake per file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        
         # Create downloads directory
         self.downloads_dir = "ca_lahore_2025_pdfs"
         if not os.path.exists(self.downloads_dir):
@@ -125,6 +138,11 @@ class CALahore2025Extractor:
             print(f"❌ Search failed: {e}")
             return False
     
+    def pdf_filename(self, case_no, pdf_type):
+        """Safe local filename for a case's PDF"""
+        safe_case_no = re.sub(r'[<>:"/\\|?*]', '_', case_no)
+        return f"{safe_case_no}_{pdf_type}.pdf"
+    
     def download_pdf(self, pdf_url, case_no, pdf_type):
         """Download PDF file"""
         try:
@@ -135,19 +153,17 @@ class CALahore2025Extractor:
             if pdf_url.startswith('/'):
                 pdf_url = urljoin(self.base_url, pdf_url)
             
-            # Create safe filename
-            safe_case_no = re.sub(r'[<>:"/\\|?*]', '_', case_no)
-            filename = f"{safe_case_no}_{pdf_type}.pdf"
+            filename = self.pdf_filename(case_no, pdf_type)
             filepath = os.path.join(self.downloads_dir, filename)
             
             print(f"📄 Downloading {pdf_type} PDF for {case_no}...")
             
-            # Download PDF
-            response = requests.get(pdf_url, timeout=30)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            # Stream the PDF to disk in 64 KB chunks rather than holding it in memory
+            with self.session.get(pdf_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
             
             print(f"✅ Downloaded: {filename}")
             return filepath
@@ -157,7 +173,9 @@ class CALahore2025Extractor:
             return f"Download Failed: {str(e)}"
     
     def extract_detailed_case_info(self, case_index):
-        """Extract detailed case information with PDF downloads"""
+        """Extract detailed case information; returns (case_data, pending PDF downloads)"""
+        # PDF section -> (href, pdf_type); downloaded later, outside the browser pass
+        pending_downloads = {}
         try:
             print(f"🔍 Processing case {case_index + 1}...")
             
@@ -166,7 +184,7 @@ class CALahore2025Extractor:
             
             if case_index >= len(view_details_links):
                 print(f"⚠️ Case index {case_index} out of range")
-                return None
+                return None, []
             
             # Click View Details
             link = view_details_links[case_index]
@@ -176,8 +194,7 @@ class CALahore2025Extractor:
             time.sleep(4)
             
             # Extract information
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            page_text = soup.get_text()
+            soup = BeautifulSoup(self.driver.page_source, 'lxml')
             
             # Initialize case structure
             case_data = {
@@ -204,9 +221,6 @@ class CALahore2025Extractor:
                 }
             }
             
-            # Extract information using specific HTML structure
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
             # Extract Case No from spCaseNo
             case_no_span = soup.find('span', {'id': 'spCaseNo'})
             if case_no_span:
@@ -274,9 +288,8 @@ class CALahore2025Extractor:
                     if href:
                         case_data["Petition_Appeal_Memo"]["File"] = href
                         case_data["Petition_Appeal_Memo"]["Type"] = "PDF"
-                        # Download memo PDF
-                        download_path = self.download_pdf(href, case_data["Case_No"], "memo")
-                        case_data["Petition_Appeal_Memo"]["Downloaded_Path"] = download_path
+                        # Queue memo PDF for download
+                        pending_downloads["Petition_Appeal_Memo"] = (href, "memo")
                         break
             
             # Extract History information
@@ -299,9 +312,8 @@ class CALahore2025Extractor:
                 if href and ('judgment' in link_text or 'order' in link_text):
                     case_data["Judgement_Order"]["File"] = href
                     case_data["Judgement_Order"]["Type"] = "PDF"
-                    # Download judgment PDF
-                    download_path = self.download_pdf(href, case_data["Case_No"], "judgment")
-                    case_data["Judgement_Order"]["Downloaded_Path"] = download_path
+                    # Queue judgment PDF for download
+                    pending_downloads["Judgement_Order"] = (href, "judgment")
                     break
             
             # Remove the advocate section parsing since we're using HTML-based extraction now
@@ -317,18 +329,17 @@ class CALahore2025Extractor:
                     if 'memo' in link_text or 'petition' in link_text or 'appeal' in link_text:
                         case_data["Petition_Appeal_Memo"]["File"] = href
                         case_data["Petition_Appeal_Memo"]["Type"] = "PDF"
-                        # Download memo PDF
-                        download_path = self.download_pdf(href, case_data["Case_No"], "memo")
-                        case_data["Petition_Appeal_Memo"]["Downloaded_Path"] = download_path
+                        # Queue memo PDF for download
+                        pending_downloads["Petition_Appeal_Memo"] = (href, "memo")
                     
                     elif 'judgment' in link_text or 'order' in link_text:
                         case_data["Judgement_Order"]["File"] = href
                         case_data["Judgement_Order"]["Type"] = "PDF"
-                        # Download judgment PDF
-                        download_path = self.download_pdf(href, case_data["Case_No"], "judgment")
-                        case_data["Judgement_Order"]["Downloaded_Path"] = download_path
+                        # Queue judgment PDF for download
+                        pending_downloads["Judgement_Order"] = (href, "judgment")
             
             # Extract history
+            page_text = soup.get_text()
             history_match = re.search(r'History:?\s*([^\n\r]+)', page_text, re.IGNORECASE)
             if history_match:
                 history_text = history_match.group(1).strip()
@@ -343,7 +354,13 @@ class CALahore2025Extractor:
             self.handle_form_resubmission()
             
             print(f"✅ Case {case_index + 1} processed: {case_data['Case_No']}")
-            return case_data
+            # Cases without a parsed number would all share the 'N/A' filenames;
+            # name their PDFs after the case's position instead
+            file_case_no = case_data["Case_No"]
+            if file_case_no == "N/A":
+                file_case_no = f"case_{case_index + 1}"
+            return case_data, [(case_data[section], href, file_case_no, pdf_type)
+                               for section, (href, pdf_type) in pending_downloads.items()]
             
         except Exception as e:
             print(f"❌ Error processing case {case_index + 1}: {e}")
@@ -353,7 +370,7 @@ class CALahore2025Extractor:
                 self.handle_form_resubmission()
             except:
                 pass
-            return None
+            return None, []
     
     def get_total_cases_count(self):
         """Get total number of cases on current page"""
@@ -364,8 +381,9 @@ class CALahore2025Extractor:
             return 0
     
     def extract_all_cases(self):
-        """Extract all C.A. Lahore 2025 cases with details and PDFs"""
+        """Extract all C.A. Lahore 2025 cases; returns (cases, pending PDF downloads)"""
         all_cases = []
+        pending_downloads = []
         
         try:
             total_cases = self.get_total_cases_count()
@@ -373,14 +391,15 @@ class CALahore2025Extractor:
             
             if total_cases == 0:
                 print("⚠️ No cases found on page")
-                return []
+                return [], []
             
             # Process each case
             for i in range(total_cases):
-                case_data = self.extract_detailed_case_info(i)
+                case_data, case_downloads = self.extract_detailed_case_info(i)
                 
                 if case_data:
                     all_cases.append(case_data)
+                    pending_downloads.extend(case_downloads)
                     print(f"✅ Processed case {i+1}/{total_cases}: {case_data.get('Case_No', 'Unknown')}")
                 else:
                     print(f"⚠️ Failed to process case {i+1}/{total_cases}")
@@ -388,11 +407,38 @@ class CALahore2025Extractor:
                 # Small delay between cases
                 time.sleep(2)
             
-            return all_cases
+            return all_cases, pending_downloads
             
         except Exception as e:
             print(f"❌ Error in extraction: {e}")
-            return all_cases
+            return all_cases, pending_downloads
+    
+    def download_all_pdfs(self, pending_downloads, max_workers=8):
+        """Download queued PDFs in parallel and record each path on its case entry"""
+        if not pending_downloads:
+            return
+        
+        print(f"\n📥 Downloading {len(pending_downloads)} PDFs with {max_workers} threads...")
+        
+        # Downloads are plain HTTP over the shared session, so they can run
+        # concurrently once the (single-threaded) browser pass is done
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # One task per target file: entries that map to the same file (e.g. a
+            # case listed twice) share its result instead of writing it concurrently
+            file_futures = {}
+            future_to_entries = {}
+            for entry, href, case_no, pdf_type in pending_downloads:
+                filename = self.pdf_filename(case_no, pdf_type)
+                if filename not in file_futures:
+                    future = executor.submit(self.download_pdf, href, case_no, pdf_type)
+                    file_futures[filename] = future
+                    future_to_entries[future] = []
+                future_to_entries[file_futures[filename]].append(entry)
+            
+            for future in as_completed(future_to_entries):
+                download_path = future.result()
+                for entry in future_to_entries[future]:
+                    entry["Downloaded_Path"] = download_path
     
     def run_extraction(self):
         """Run the complete extraction process"""
@@ -413,7 +459,13 @@ class CALahore2025Extractor:
                 return False
             
             # Extract all cases
-            self.extracted_cases = self.extract_all_cases()
+            self.extracted_cases, pending_downloads = self.extract_all_cases()
+            
+            # Browser work is done; release it before the download phase
+            self.driver.quit()
+            self.driver = None
+            
+            self.download_all_pdfs(pending_downloads)
             
             print(f"\n🎯 EXTRACTION COMPLETED: {len(self.extracted_cases)} cases processed")
             
@@ -426,6 +478,7 @@ class CALahore2025Extractor:
         finally:
             if self.driver:
                 self.driver.quit()
+            self.session.close()
     
     def save_results(self, filename="ca_lahore_2025_complete_with_pdfs.json"):
         """Save results to JSON file"""